@@ -1,20 +1,32 @@
 #!/usr/bin/env python3
-import pygame
 import sys
 import random
 import os
 import time
 import math
-import pygame.freetype
+import operator
+from array import array
+from collections import OrderedDict
+from itertools import repeat
+from hangman_corpus import Corpus
+from hangman_engine import DIFFICULTY_EASY, DIFFICULTY_MEDIUM, DIFFICULTY_HARD, DIFFICULTY_SETTINGS, HangmanRound, new_round
+from hangman_solver import new_evil_round
+from hangman_sound import beep_bytes
+from hangman_words import categories
 
-# Initialize pygame
-pygame.init()
-pygame.mixer.init()  # For sound effects
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Nothing below touches SDL at import time - pygame, the window, fonts,
+# the background image and sounds are set up by init_game(). pygame itself
+# is imported there too, so the word data and rules load without it.
+pygame = None
 
-# Get the user's screen resolution
-info = pygame.display.Info()
-SCREEN_WIDTH = info.current_w
-SCREEN_HEIGHT = info.current_h
+# The user's screen resolution (read by init_game)
+SCREEN_WIDTH = None
+SCREEN_HEIGHT = None
 
 # Flag to track fullscreen state
 fullscreen = False
@@ -47,73 +59,122 @@ GROUND_GREEN = (34, 139, 34)
 TREE_GREEN = (0, 100, 0)
 MOUNTAIN_GRAY = (100, 100, 100)
 BROWN = (139, 69, 19)
+LAYER_COLORKEY = (255, 0, 255)  # Transparent key for pre-rendered parallax layers
 
 # Font settings
 FONT_COLOR = (240, 240, 240)  # High contrast font color
 
 # Game settings
 FPS = 60
+SMOOTH_BACKGROUND = True  # Use smoothscale when resizing background.png
+DIRTY_RECTS = True        # Update only changed areas on static screens
+TIMER_FPS = 10            # Frame rate while only the countdown timer changes
+IDLE_WAIT_MS = 500        # Longest sleep between frames on an idle screen
+SHOW_FRAME_MODE = False   # Show the frame scheduler mode in the window title
+ANIMATION_RATE = 60       # Frame rate the per-frame animation steps were tuned at
+MAX_FRAME_TIME = 0.25     # Longest time step, in seconds, after a stall
+FIXED_TIMESTEP = None     # Animation seconds per frame for deterministic replays (None = real time); the round timer always runs on real time
 GAME_TITLE = "Hangman Game"
 
 # Default window size (for windowed mode)
 DEFAULT_WIDTH = 800
 DEFAULT_HEIGHT = 600
 
-# Create the screen - start in windowed mode
-screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT), pygame.RESIZABLE)
-pygame.display.set_caption(GAME_TITLE)
-clock = pygame.time.Clock()
+# Display surface and clock (created by init_game)
+screen = None
+clock = None
+
+# Scale context - holds the scale factors for the current screen size. They
+# are recomputed only on a resize or fullscreen toggle, and the generation
+# counter tells size-dependent caches (fonts, text, button rects, parallax
+# layers) when to rebuild.
+class ScaleContext:
+    def __init__(self, size):
+        self.size = None
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+        self.generation = 0
+        self.update(size)
+    
+    def update(self, size):
+        """Recompute the scale factors; returns True if the size changed"""
+        size = tuple(size)
+        if size == self.size:
+            return False
+        self.size = size
+        self.scale_x = size[0] / DEFAULT_WIDTH
+        self.scale_y = size[1] / DEFAULT_HEIGHT
+        self.generation += 1
+        return True
 
-# Function to calculate scale factors based on current screen size
-def get_scale_factors():
-    current_w, current_h = screen.get_size()
-    scale_x = current_w / DEFAULT_WIDTH
-    scale_y = current_h / DEFAULT_HEIGHT
-    return scale_x, scale_y
+scale_context = ScaleContext((DEFAULT_WIDTH, DEFAULT_HEIGHT))
 
 # Function to scale a value based on the x-axis scale factor
 def scale_x(value):
-    scale_x, _ = get_scale_factors()
-    return int(value * scale_x)
+    return int(value * scale_context.scale_x)
 
 # Function to scale a value based on the y-axis scale factor
 def scale_y(value):
-    _, scale_y = get_scale_factors()
-    return int(value * scale_y)
+    return int(value * scale_context.scale_y)
 
 # Function to scale both x and y values
 def scale_pos(x, y):
-    scale_x, scale_y = get_scale_factors()
-    return int(x * scale_x), int(y * scale_y)
+    return int(x * scale_context.scale_x), int(y * scale_context.scale_y)
 
 # Function to scale font size
 def scale_font_size(size):
-    _, scale_y = get_scale_factors()
-    return max(int(size * scale_y), size)
+    return max(int(size * scale_context.scale_y), size)
 
-# Load background image
+# Background image (loaded by init_game)
 background_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "background.png")
-try:
-    background_image = pygame.image.load(background_path)
-    has_background = True
-except:
-    print(f"Could not load background image from {background_path}")
-    has_background = False
+has_background = False
+background_cache = None
+
+# Scaled background cache - scales and converts the image once per window
+# size, keeping a few recent sizes so fullscreen toggles are instant
+class BackgroundCache:
+    def __init__(self, image, max_sizes=3, smooth=True):
+        self.image = image
+        self.max_sizes = max_sizes
+        self.smooth = smooth
+        self.entries = OrderedDict()  # Least recently used first
+    
+    def get(self, size):
+        """Return the image scaled to size in the display format"""
+        scaled = self.entries.get(size)
+        if scaled is not None:
+            self.entries.move_to_end(size)
+            return scaled
+        
+        if self.smooth:
+            scaled = pygame.transform.smoothscale(self.image, size).convert()
+        else:
+            scaled = pygame.transform.scale(self.image, size).convert()
+        self.entries[size] = scaled
+        while len(self.entries) > self.max_sizes:
+            self.entries.popitem(last=False)
+        return scaled
+
+def load_background():
+    """Load background.png into the background cache"""
+    global has_background, background_cache
+    try:
+        # Convert to the display format so blits skip pixel-format conversion
+        background_image = pygame.image.load(background_path).convert()
+        background_cache = BackgroundCache(background_image, smooth=SMOOTH_BACKGROUND)
+        has_background = True
+    except:
+        print(f"Could not load background image from {background_path}")
+        has_background = False
 
 # Function to scale background image to current screen size
 def scale_background():
     if has_background:
-        current_w, current_h = screen.get_size()
-        return pygame.transform.scale(background_image, (current_w, current_h))
+        return background_cache.get(screen.get_size())
     return None
 
-# Function to draw a tree
-def draw_tree(surface, x, y, size):
-    # Scale based on screen size
-    x = scale_x(x)
-    y = scale_y(y)
-    size = scale_y(size)
-    
+# Function to paint a tree at pixel coordinates (x, y = base of the trunk)
+def paint_tree(surface, x, y, size):
     # Draw trunk
     trunk_width = size // 5
     trunk_height = size // 2
@@ -134,13 +195,8 @@ def draw_tree(surface, x, y, size):
         ]
         pygame.draw.polygon(surface, TREE_GREEN, points)
 
-# Function to draw a cloud
-def draw_cloud(surface, x, y, size):
-    # Scale based on screen size
-    x = scale_x(x)
-    y = scale_y(y)
-    size = scale_y(size)
-    
+# Function to paint a cloud at pixel coordinates
+def paint_cloud(surface, x, y, size):
     # Draw multiple overlapping circles for a cloud shape
     pygame.draw.circle(surface, WHITE, (x, y), size)
     pygame.draw.circle(surface, WHITE, (x + size, y), int(size * 0.8))
@@ -148,13 +204,8 @@ def draw_cloud(surface, x, y, size):
     pygame.draw.circle(surface, WHITE, (x + size // 2, y - size // 2), int(size * 0.6))
     pygame.draw.circle(surface, WHITE, (x - size // 2, y - size // 2), int(size * 0.5))
 
-# Function to draw a bird
-def draw_bird(surface, x, y, size, flap_state):
-    # Scale based on screen size
-    x = scale_x(x)
-    y = scale_y(y)
-    size = scale_y(size)
-    
+# Function to paint a bird at pixel coordinates
+def paint_bird(surface, x, y, size, flap_state):
     # Simple bird shape with flapping wings
     wing_angle = math.sin(flap_state) * 0.5  # Wing flap animation
     
@@ -178,14 +229,14 @@ def draw_bird(surface, x, y, size, flap_state):
     pygame.draw.polygon(surface, BLACK, wing_points1)
     pygame.draw.polygon(surface, BLACK, wing_points2)
 
-# Function to draw a mountain
-def draw_mountain(surface, x, y, width, height):
-    # Scale based on screen size
-    x = scale_x(x)
-    y = scale_y(y)
-    width = scale_x(width)
-    height = scale_y(height)
-    
+# Function to draw a bird
+def draw_bird(surface, x, y, size, flap_state):
+    # Pick the frame for the flap phase from the sheet at the current scale
+    sheet, area, (anchor_x, anchor_y) = bird_sheets.frame(size, flap_state)
+    surface.blit(sheet, (scale_x(x) - anchor_x, scale_y(y) - anchor_y), area)
+
+# Function to paint a mountain at pixel coordinates (x, y = left end of the base)
+def paint_mountain(surface, x, y, width, height):
     # Mountain shape
     points = [
         (x, y),  # base left
@@ -204,65 +255,243 @@ def draw_mountain(surface, x, y, width, height):
     ]
     pygame.draw.polygon(surface, WHITE, snow_points)
 
-# Function to draw a bush
-def draw_bush(surface, x, y, size):
-    # Scale based on screen size
-    x = scale_x(x)
-    y = scale_y(y)
-    size = scale_y(size)
-    
+# Number of distinct bush shapes; bushes pick one when they are created
+BUSH_VARIANTS = 4
+
+# Function to return a bush shape: five circle offsets as fractions of its size
+def bush_shape(variant):
+    rng = random.Random(variant)
+    return [(rng.uniform(-0.5, 0.5), rng.uniform(-1 / 3, 1 / 3)) for _ in range(5)]
+
+# Function to paint a bush at pixel coordinates
+def paint_bush(surface, x, y, size, variant=0):
     # Draw multiple overlapping circles for a bush shape
-    for i in range(5):
-        offset_x = random.randint(-size // 2, size // 2)
-        offset_y = random.randint(-size // 3, size // 3)
-        pygame.draw.circle(surface, TREE_GREEN, (x + offset_x, y + offset_y), size // 2)
+    for offset_x, offset_y in bush_shape(variant):
+        pygame.draw.circle(surface, TREE_GREEN, (x + int(offset_x * size), y + int(offset_y * size)), size // 2)
 
-# Background element class
-class BackgroundElement:
-    def __init__(self, element_type, x, y, size, speed):
-        self.element_type = element_type  # 'tree', 'cloud', 'bird', 'mountain', 'bush'
-        self.base_x = x  # Store original positions for scaling
-        self.base_y = y
-        self.base_size = size
-        self.speed = speed
-        self.flap_state = random.random() * 6.28  # Random start position for bird wing flap
-        
-        # For mountains
+class ElementSprites:
+    """Pre-rendered trees, clouds, mountains and bushes, shared by elements of
+    the same type, size and variant, and rebuilt for each scale generation"""
+    
+    def __init__(self):
+        self.sprites = {}  # (type, size, variant) -> (surface, anchor)
+        self.generation = None
+    
+    def get(self, element_type, size, variant):
+        """Return the sprite and the pixel within it that sits at the element's position"""
+        if self.generation != scale_context.generation:
+            self.generation = scale_context.generation
+            self.sprites.clear()
+        key = (element_type, size, variant)
+        entry = self.sprites.get(key)
+        if entry is None:
+            entry = self.sprites[key] = self.render(element_type, size, variant)
+        return entry
+    
+    def render(self, element_type, size, variant):
+        pixel_size = scale_y(size)
         if element_type == 'mountain':
-            self.width = size * 3
-            self.height = size * 2
+            width, height = scale_x(size * 3), scale_y(size * 2)
+            extent = max(width, height)
+        else:
+            extent = pixel_size * 2
+        
+        # Paint around the middle of a scratch canvas, then crop to the shape
+        canvas = pygame.Surface((extent * 2 + 2, extent * 2 + 2))
+        canvas.fill(LAYER_COLORKEY)
+        canvas.set_colorkey(LAYER_COLORKEY)
+        origin = extent + 1
+        if element_type == 'tree':
+            paint_tree(canvas, origin, origin, pixel_size)
+        elif element_type == 'cloud':
+            paint_cloud(canvas, origin, origin, pixel_size)
+        elif element_type == 'mountain':
+            paint_mountain(canvas, origin, origin, width, height)
+        elif element_type == 'bush':
+            paint_bush(canvas, origin, origin, pixel_size, variant)
+        
+        bounds = canvas.get_bounding_rect()
+        sprite = canvas.subsurface(bounds).convert()
+        sprite.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+        return sprite, (origin - bounds.x, origin - bounds.y)
+
+element_sprites = ElementSprites()
+
+# Frames in one wing-flap cycle of the bird sprite sheets
+BIRD_FLAP_FRAMES = 16
+
+class BirdSheets:
+    """One sprite sheet of flap frames per bird size, rebuilt lazily for each scale generation"""
     
-    def update(self):
-        # Move element from right to left
-        self.base_x -= self.speed
+    def __init__(self, frames=BIRD_FLAP_FRAMES):
+        self.frames = frames
+        self.sheets = {}  # size -> (sheet, cell size)
+        self.generation = None
+    
+    def frame(self, size, flap_state):
+        """Return (sheet, area, anchor) for a bird's current flap phase"""
+        if self.generation != scale_context.generation:
+            self.generation = scale_context.generation
+            self.sheets.clear()
+        entry = self.sheets.get(size)
+        if entry is None:
+            entry = self.sheets[size] = self.render(size)
+        sheet, cell = entry
+        index = int(flap_state / math.tau * self.frames) % self.frames
+        return sheet, pygame.Rect(index * cell, 0, cell, cell), (cell // 2, cell // 2)
+    
+    def render(self, size):
+        pixel_size = scale_y(size)
+        # Wing tips reach size // 2 + size * 0.5 from the body; leave room all round
+        cell = pixel_size * 2 + 2
+        sheet = pygame.Surface((cell * self.frames, cell))
+        sheet.fill(LAYER_COLORKEY)
+        for index in range(self.frames):
+            flap_state = (index + 0.5) * math.tau / self.frames
+            paint_bird(sheet, index * cell + cell // 2, cell // 2, pixel_size, flap_state)
+        sheet = sheet.convert()
+        sheet.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+        return sheet, cell
+
+bird_sheets = BirdSheets()
+
+# How far a bird's wing flap phase advances per frame
+BIRD_FLAP_STEP = 0.2
+
+class ElementArrays:
+    """Background element state stored column-wise, one array per field.
+    
+    update() moves every element in one vectorized step (NumPy when it is
+    installed, otherwise C-level map() chains over array.array columns), so
+    dense scenes do not cost a Python loop per element.
+    """
+    
+    def __init__(self):
+        self.types = []     # Element type names, by index
+        self.variants = []  # Shape variant, by index (bushes only)
+        columns = {name: [] for name in ("x", "y", "size", "speed", "flap")}
+        self.columns = columns
+    
+    def add(self, element_type, x, y, size, speed):
+        """Add an element and return its index"""
+        self.types.append(element_type)
+        self.variants.append(random.randrange(BUSH_VARIANTS) if element_type == 'bush' else 0)
+        self.columns["x"].append(x)
+        self.columns["y"].append(y)
+        self.columns["size"].append(size)
+        self.columns["speed"].append(speed)
+        self.columns["flap"].append(random.random() * 6.28)  # Random start position for bird wing flap
+        return len(self.types) - 1
+    
+    def pack(self):
+        """Turn the collected columns into arrays, with the per-element update constants"""
+        def column(values):
+            return numpy.array(values, dtype=float) if numpy is not None else array("d", values)
+        columns = self.columns
+        is_bird = [element_type == 'bird' for element_type in self.types]
+        self.x = column(columns["x"])
+        self.y = column(columns["y"])
+        self.size = column(columns["size"])
+        self.speed = column(columns["speed"])
+        self.flap = column(columns["flap"])
+        # Birds keep moving when the other elements scroll as pre-rendered layers
+        self.bird_speed = column([speed if bird else 0 for speed, bird in zip(columns["speed"], is_bird)])
+        self.flap_step = column([BIRD_FLAP_STEP if bird else 0 for bird in is_bird])
+        # Elements wrap from x < -3 * size back to DEFAULT_WIDTH + size
+        self.wrap_margin = column([size * 3 for size in columns["size"]])
+        self.wrap_period = column([DEFAULT_WIDTH + size * 4 for size in columns["size"]])
+        self.columns = None
+    
+    def update(self, frames=1, birds_only=False):
+        """Move every element left by frames steps, wrapping at the edges, and flap the birds"""
+        speed = self.bird_speed if birds_only else self.speed
+        if numpy is not None:
+            self.x -= speed * frames
+            self.x += self.wrap_margin
+            numpy.mod(self.x, self.wrap_period, out=self.x)
+            self.x -= self.wrap_margin
+            self.flap += self.flap_step * frames
+            numpy.mod(self.flap, math.tau, out=self.flap)
+            return
         
-        # Reset position if it moves off screen
-        if self.base_x < -self.base_size * 3:
-            self.base_x = DEFAULT_WIDTH + self.base_size
-            
-        # Update bird wing flap animation
-        if self.element_type == 'bird':
-            self.flap_state += 0.2
+        moved = map(operator.sub, self.x, map(operator.mul, speed, repeat(frames)))
+        shifted = map(operator.add, moved, self.wrap_margin)
+        self.x[:] = array("d", map(operator.sub, map(operator.mod, shifted, self.wrap_period), self.wrap_margin))
+        flapped = map(operator.add, self.flap, map(operator.mul, self.flap_step, repeat(frames)))
+        self.flap[:] = array("d", map(operator.mod, flapped, repeat(math.tau)))
+
+# Background element class - a view of one row of the element arrays
+class BackgroundElement:
+    __slots__ = ("arrays", "index", "element_type", "variant")
     
-    def draw(self, surface):
-        # Draw the appropriate element type
-        if self.element_type == 'tree':
-            draw_tree(surface, self.base_x, self.base_y, self.base_size)
-        elif self.element_type == 'cloud':
-            draw_cloud(surface, self.base_x, self.base_y, self.base_size)
-        elif self.element_type == 'bird':
-            draw_bird(surface, self.base_x, self.base_y, self.base_size, self.flap_state)
-        elif self.element_type == 'mountain':
-            draw_mountain(surface, self.base_x, self.base_y, self.width, self.height)
-        elif self.element_type == 'bush':
-            draw_bush(surface, self.base_x, self.base_y, self.base_size)
+    def __init__(self, arrays, index):
+        self.arrays = arrays
+        self.index = index
+        self.element_type = arrays.types[index]  # 'tree', 'cloud', 'bird', 'mountain', 'bush'
+        self.variant = arrays.variants[index]
+    
+    @property
+    def base_x(self):
+        return self.arrays.x[self.index]
+    
+    @property
+    def base_y(self):
+        return self.arrays.y[self.index]
+    
+    @property
+    def base_size(self):
+        return self.arrays.size[self.index]
+    
+    @property
+    def speed(self):
+        return self.arrays.speed[self.index]
+    
+    @property
+    def flap_state(self):
+        return self.arrays.flap[self.index]
+    
+    # For mountains
+    @property
+    def width(self):
+        return self.base_size * 3
+    
+    @property
+    def height(self):
+        return self.base_size * 2
+    
+    def draw(self, surface, offset_x=0):
+        # Draw the element, optionally shifted horizontally
+        x = self.base_x + offset_x
+        if self.element_type == 'bird':
+            draw_bird(surface, x, self.base_y, self.base_size, self.flap_state)
+            return
+        # Everything else is a cached sprite
+        sprite, (anchor_x, anchor_y) = element_sprites.get(self.element_type, self.base_size, self.variant)
+        surface.blit(sprite, (scale_x(x) - anchor_x, scale_y(self.base_y) - anchor_y))
+
+# Function to draw a flock of birds with one batched blit call
+def draw_birds(surface, birds):
+    blits = []
+    for bird in birds:
+        sheet, area, (anchor_x, anchor_y) = bird_sheets.frame(bird.base_size, bird.flap_state)
+        blits.append((sheet, (scale_x(bird.base_x) - anchor_x, scale_y(bird.base_y) - anchor_y), area))
+    surface.blits(blits, doreturn=False)
 
 # Improved parallax background class
 class ImprovedParallaxBackground:
     def __init__(self):
-        self.elements = []
+        self.arrays = ElementArrays()  # Positions, sizes, speeds and flap phases
+        self.elements = []             # One view per element, back to front
         self.active = True
         
+        # Layered mode: each speed band is rasterized once into a tileable
+        # strip and scrolled with blits; birds are still drawn per element
+        self.layered = True
+        self.layers = None       # List of (speed, strip surface, y) per band
+        self.layer_size = None   # Screen size the strips were built for
+        self.layer_generation = None
+        self.layer_offsets = {}  # Scroll offset per band, in unscaled pixels
+        
         # Create background elements
         self.create_elements()
     
@@ -272,60 +501,126 @@ class ImprovedParallaxBackground:
             mountain_size = random.randint(100, 200)
             mountain_x = random.randint(0, DEFAULT_WIDTH)
             mountain_y = int(DEFAULT_HEIGHT * 0.7)  # Ground level
-            self.elements.append(BackgroundElement('mountain', mountain_x, mountain_y, mountain_size, 0.2))
+            self.arrays.add('mountain', mountain_x, mountain_y, mountain_size, 0.2)
         
         # Far trees (slow)
         for i in range(15):
             tree_size = random.randint(50, 80)
             tree_x = random.randint(0, DEFAULT_WIDTH)
             tree_y = int(DEFAULT_HEIGHT * 0.7)  # Ground level
-            self.elements.append(BackgroundElement('tree', tree_x, tree_y, tree_size, 0.5))
+            self.arrays.add('tree', tree_x, tree_y, tree_size, 0.5)
         
         # Bushes (medium speed)
         for i in range(10):
             bush_size = random.randint(20, 40)
             bush_x = random.randint(0, DEFAULT_WIDTH)
             bush_y = int(DEFAULT_HEIGHT * 0.7) + bush_size // 2  # Ground level
-            self.elements.append(BackgroundElement('bush', bush_x, bush_y, bush_size, 1))
+            self.arrays.add('bush', bush_x, bush_y, bush_size, 1)
         
         # Medium trees (medium speed)
         for i in range(10):
             tree_size = random.randint(80, 120)
             tree_x = random.randint(0, DEFAULT_WIDTH)
             tree_y = int(DEFAULT_HEIGHT * 0.7)  # Ground level
-            self.elements.append(BackgroundElement('tree', tree_x, tree_y, tree_size, 1.5))
+            self.arrays.add('tree', tree_x, tree_y, tree_size, 1.5)
         
         # Near trees (fast)
         for i in range(8):
             tree_size = random.randint(120, 180)
             tree_x = random.randint(0, DEFAULT_WIDTH)
             tree_y = int(DEFAULT_HEIGHT * 0.7)  # Ground level
-            self.elements.append(BackgroundElement('tree', tree_x, tree_y, tree_size, 2.5))
+            self.arrays.add('tree', tree_x, tree_y, tree_size, 2.5)
         
         # Clouds (very slow)
         for i in range(8):
             cloud_size = random.randint(20, 40)
             cloud_x = random.randint(0, DEFAULT_WIDTH)
             cloud_y = random.randint(50, int(DEFAULT_HEIGHT * 0.4))
-            self.elements.append(BackgroundElement('cloud', cloud_x, cloud_y, cloud_size, 0.3))
+            self.arrays.add('cloud', cloud_x, cloud_y, cloud_size, 0.3)
         
         # Birds (medium speed)
         for i in range(5):
             bird_size = random.randint(15, 30)
             bird_x = random.randint(0, DEFAULT_WIDTH)
             bird_y = random.randint(100, int(DEFAULT_HEIGHT * 0.5))
-            self.elements.append(BackgroundElement('bird', bird_x, bird_y, bird_size, 1.8))
+            self.arrays.add('bird', bird_x, bird_y, bird_size, 1.8)
+        
+        self.arrays.pack()
+        self.elements = [BackgroundElement(self.arrays, index) for index in range(len(self.arrays.types))]
         
         # Sort elements by speed (for proper layering)
         self.elements.sort(key=lambda x: x.speed)
     
-    def update(self):
+    def update(self, dt):
         if not self.active:
             return
+        # Speeds are in pixels per 60 Hz frame
+        frames = dt * ANIMATION_RATE
+        
+        if self.layered:
+            # Scroll the pre-rendered bands and move only the birds
+            for speed in self.layer_offsets:
+                self.layer_offsets[speed] = (self.layer_offsets[speed] + speed * frames) % DEFAULT_WIDTH
+            self.arrays.update(frames, birds_only=True)
+            return
             
         # Update all elements
+        self.arrays.update(frames)
+    
+    def build_layers(self, surface):
+        """Rasterize each speed band into a strip that tiles horizontally"""
+        width, height = surface.get_size()
+        self.layers = []
+        self.layer_size = (width, height)
+        self.layer_generation = scale_context.generation
+        
+        bands = {}
         for element in self.elements:
-            element.update()
+            if element.element_type != 'bird':
+                bands.setdefault(element.speed, []).append(element)
+        
+        for speed in sorted(bands):
+            # Colorkeyed rather than per-pixel alpha: the shapes are opaque,
+            # and RLE colorkey blits are far cheaper than alpha blending
+            canvas = pygame.Surface((width, height))
+            canvas.fill(LAYER_COLORKEY)
+            canvas.set_colorkey(LAYER_COLORKEY)
+            for element in bands[speed]:
+                # Draw wrapped copies so the strip joins up seamlessly
+                for offset_x in (-DEFAULT_WIDTH, 0, DEFAULT_WIDTH):
+                    element.draw(canvas, offset_x)
+            
+            # Keep only the rows the band actually covers
+            bounds = canvas.get_bounding_rect()
+            if bounds.height == 0:
+                continue
+            strip = canvas.subsurface((0, bounds.y, width, bounds.height)).convert()
+            strip.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+            self.layers.append((speed, strip, bounds.y))
+            self.layer_offsets.setdefault(speed, 0)
+    
+    def draw_layers(self, surface):
+        """Blit the scrolled band strips, with birds at their own depth"""
+        if self.layers is None or self.layer_generation != scale_context.generation:
+            self.build_layers(surface)
+        
+        scale = scale_context.scale_x
+        width = self.layer_size[0]
+        birds = [element for element in self.elements if element.element_type == 'bird']
+        birds_drawn = False
+        
+        for speed, strip, y in self.layers:
+            if not birds_drawn and birds and speed > birds[0].speed:
+                draw_birds(surface, birds)
+                birds_drawn = True
+            
+            # Blit the strip twice so the scrolled slice wraps around
+            offset = int(self.layer_offsets[speed] * scale) % width
+            surface.blit(strip, (-offset, y))
+            surface.blit(strip, (width - offset, y))
+        
+        if not birds_drawn:
+            draw_birds(surface, birds)
     
     def draw(self, surface):
         # Draw sky
@@ -336,6 +631,10 @@ class ImprovedParallaxBackground:
         ground_rect = pygame.Rect(0, scale_y(DEFAULT_HEIGHT * 0.7), surface.get_width(), surface.get_height() - scale_y(DEFAULT_HEIGHT * 0.7))
         pygame.draw.rect(surface, GROUND_GREEN, ground_rect)
         
+        if self.layered:
+            self.draw_layers(surface)
+            return
+        
         # Draw all elements in order (background to foreground)
         for element in self.elements:
             element.draw(surface)
@@ -343,109 +642,516 @@ class ImprovedParallaxBackground:
     def toggle(self):
         self.active = not self.active
     
+    def toggle_layers(self):
+        self.layered = not self.layered
+    
     def resize(self):
-        # No specific resize needed as all drawing functions use scale_x and scale_y
-        pass
-# Try to load a pixel/arcade style font
-try:
-    # Check for the Press Start 2P font first (a pixel font perfect for games)
-    press_start_font = os.path.join(os.path.expanduser("~"), "fonts", "PressStart2P-Regular.ttf")
-    if os.path.exists(press_start_font):
-        # Create font loading function that considers screen scaling
-        def get_title_font():
-            return pygame.font.Font(press_start_font, scale_font_size(36))
-        def get_large_font():
-            return pygame.font.Font(press_start_font, scale_font_size(24))
-        def get_medium_font():
-            return pygame.font.Font(press_start_font, scale_font_size(16))
-        def get_small_font():
-            return pygame.font.Font(press_start_font, scale_font_size(12))
-        print("Using Press Start 2P font")
-    else:
-        # Check if a pixel font exists in the directory
-        font_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pixel_font.ttf")
-        if os.path.exists(font_path):
-            def get_title_font():
-                return pygame.font.Font(font_path, scale_font_size(48))
-            def get_large_font():
-                return pygame.font.Font(font_path, scale_font_size(36))
-            def get_medium_font():
-                return pygame.font.Font(font_path, scale_font_size(28))
-            def get_small_font():
-                return pygame.font.Font(font_path, scale_font_size(20))
+        # Band strips are rasterized at the screen size, so rebuild them lazily
+        self.layers = None
+# Font manager - keeps loaded fonts cached by (face, scaled size) so the
+# frame loop never reads or parses a font file
+class FontManager:
+    def __init__(self, face, sizes, sysfont=False):
+        self.face = face        # Font file path or system font name
+        self.sizes = sizes      # Base (unscaled) size for each font role
+        self.sysfont = sysfont
+        self.fonts = {}
+        self.keys = {}          # id(font) -> cache key, for callers that key on fonts
+        self.current = {}       # role -> font for the current scale generation
+        self.generation = None
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, size):
+        """Load the face at the given pixel size"""
+        if self.sysfont:
+            return pygame.font.SysFont(self.face, size, bold=True)
+        return pygame.font.Font(self.face, size)
+
+    def get(self, role):
+        """Return the font for a role at the current scale"""
+        if self.generation != scale_context.generation:
+            # Screen size changed - forget fonts loaded for the old size
+            self.generation = scale_context.generation
+            self.current = {}
+            self.drop_stale()
+        
+        font = self.current.get(role)
+        if font is not None:
+            self.hits += 1
+            return font
+        
+        key = (self.face, scale_font_size(self.sizes[role]))
+        font = self.fonts.get(key)
+        if font is None:
+            self.misses += 1
+            font = self.load(key[1])
+            self.fonts[key] = font
+            self.keys[id(font)] = key
+        else:
+            self.hits += 1
+        self.current[role] = font
+        return font
+
+    def drop_stale(self):
+        """Forget fonts whose size no longer matches the current scale"""
+        current = {(self.face, scale_font_size(size)) for size in self.sizes.values()}
+        for key in list(self.fonts):
+            if key not in current:
+                del self.keys[id(self.fonts.pop(key))]
+
+    def key_of(self, font):
+        """Return the (face, size) key of a font loaded by this manager"""
+        return self.keys.get(id(font), id(font))
+
+    def stats(self):
+        """Return cache hit/miss counts"""
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self.fonts)}
+
+# Font manager for the chosen face (set up by init_game)
+font_manager = None
+
+def load_fonts():
+    """Pick a pixel/arcade style font and create the font manager"""
+    global font_manager
+    # Try to load a pixel/arcade style font
+    try:
+        # Check for the Press Start 2P font first (a pixel font perfect for games)
+        press_start_font = os.path.join(os.path.expanduser("~"), "fonts", "PressStart2P-Regular.ttf")
+        if os.path.exists(press_start_font):
+            font_manager = FontManager(press_start_font, {"title": 36, "large": 24, "medium": 16, "small": 12})
+            print("Using Press Start 2P font")
+        else:
+            # Check if a pixel font exists in the directory
+            font_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pixel_font.ttf")
+            if os.path.exists(font_path):
+                font_manager = FontManager(font_path, {"title": 48, "large": 36, "medium": 28, "small": 20})
+            else:
+                # Fall back to system fonts with bold style for arcade feel
+                font_manager = FontManager('Arial', {"title": 48, "large": 36, "medium": 28, "small": 20}, sysfont=True)
+    except:
+        # Fallback if font loading fails
+        font_manager = FontManager('Arial', {"title": 48, "large": 36, "medium": 28, "small": 20}, sysfont=True)
+
+# Font accessors - sized for the current screen scale
+def get_title_font():
+    return font_manager.get("title")
+
+def get_large_font():
+    return font_manager.get("large")
+
+def get_medium_font():
+    return font_manager.get("medium")
+
+def get_small_font():
+    return font_manager.get("small")
+
+# Function to render text with its black drop shadow onto one surface
+def render_shadowed(text, font, color, shadow_offset=(0, 0)):
+    text_surface = font.render(text, True, color)
+    dx, dy = shadow_offset
+    if not (dx or dy):
+        return text_surface
+    shadow = font.render(text, True, BLACK)
+    surface = pygame.Surface((text_surface.get_width() + abs(dx), text_surface.get_height() + abs(dy)), pygame.SRCALPHA)
+    surface.blit(shadow, (max(dx, 0), max(dy, 0)))
+    surface.blit(text_surface, (max(-dx, 0), max(-dy, 0)))
+    return surface
+
+# Rendered text cache - keeps pre-composited shadow+text surfaces so labels
+# are rendered once instead of twice per frame
+class TextCache:
+    def __init__(self, max_entries=256, max_bytes=16 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # Least recently used first
+        self.bytes = 0
+        self.generation = scale_context.generation
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, font, color, shadow_offset=(0, 0)):
+        """Return a surface with the black shadow and the colored text"""
+        if self.generation != scale_context.generation:
+            # Scale factors changed - cached sizes and offsets are stale
+            self.generation = scale_context.generation
+            self.clear()
+        
+        key = (text, font_manager.key_of(font), color, shadow_offset)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = render_shadowed(text, font, color, shadow_offset)
+        self.entries[key] = surface
+        self.bytes += self.surface_bytes(surface)
+        
+        # Evict least recently used entries when over budget
+        while len(self.entries) > self.max_entries or (self.bytes > self.max_bytes and len(self.entries) > 1):
+            _, old = self.entries.popitem(last=False)
+            self.bytes -= self.surface_bytes(old)
+        return surface
+
+    @staticmethod
+    def surface_bytes(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def clear(self):
+        """Drop all cached surfaces, e.g. when the scale factors change"""
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Return cache hit/miss counts and memory use"""
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self.entries), "bytes": self.bytes}
+
+text_cache = TextCache()
+
+# Function to draw cached text with a drop shadow; the anchor keyword
+# (center, topleft, topright, ...) positions the main text, not the shadow
+def blit_text(surface, text, font, color, shadow_offset=(0, 0), **anchor):
+    cached = text_cache.render(text, font, color, shadow_offset)
+    dx, dy = shadow_offset
+    text_rect = pygame.Rect(0, 0, cached.get_width() - abs(dx), cached.get_height() - abs(dy))
+    for name, value in anchor.items():
+        setattr(text_rect, name, value)
+    surface.blit(cached, (text_rect.x - max(-dx, 0), text_rect.y - max(-dy, 0)))
+    return text_rect
+
+# Words longer than this are drawn glyph by glyph from the text cache
+GLYPH_LINE_LENGTH = 16
+
+class WordLine:
+    """The masked word, rendered once per round and updated as letters are revealed"""
+    
+    def __init__(self):
+        self.surface = None
+        self.round = None
+        self.generation = None
+        self.style = None
+        self.word = None       # Word the glyph cells were sized for
+        self.hidden = 0        # Letters hidden when the surface was made
+        self.guess_count = 0   # Guesses applied to the surface
+        self.cell_width = 0    # Per-character cell, in glyph mode
+        self.version = 0       # Bumped whenever the surface changes
+    
+    def refresh(self, hangman_round, font, color, shadow_offset):
+        """Bring the surface up to date with the round; returns True if it changed"""
+        style = (font_manager.key_of(font), color, shadow_offset)
+        # An evil round swaps its word as it dodges guesses, which can change
+        # the glyphs in play without changing the number of hidden letters
+        if (hangman_round is not self.round or self.generation != scale_context.generation
+                or self.style != style or self.surface is None or hangman_round.word != self.word):
+            self.round = hangman_round
+            self.generation = scale_context.generation
+            self.style = style
+            self.word = hangman_round.word
+            self.build(font, color, shadow_offset)
+        elif len(hangman_round.remaining) != self.hidden:
+            if self.cell_width:
+                self.reveal(font, color, shadow_offset)
+            else:
+                self.build(font, color, shadow_offset)
         else:
-            # Fall back to system fonts with bold style for arcade feel
-            def get_title_font():
-                return pygame.font.SysFont('Arial', scale_font_size(48), bold=True)
-            def get_large_font():
-                return pygame.font.SysFont('Arial', scale_font_size(36), bold=True)
-            def get_medium_font():
-                return pygame.font.SysFont('Arial', scale_font_size(28), bold=True)
-            def get_small_font():
-                return pygame.font.SysFont('Arial', scale_font_size(20), bold=True)
-except:
-    # Fallback if font loading fails
-    def get_title_font():
-        return pygame.font.SysFont('Arial', scale_font_size(48), bold=True)
-    def get_large_font():
-        return pygame.font.SysFont('Arial', scale_font_size(36), bold=True)
-    def get_medium_font():
-        return pygame.font.SysFont('Arial', scale_font_size(28), bold=True)
-    def get_small_font():
-        return pygame.font.SysFont('Arial', scale_font_size(20), bold=True)
+            return False
+        self.hidden = len(hangman_round.remaining)
+        self.guess_count = len(hangman_round.guessed_letters)
+        self.version += 1
+        return True
+    
+    def build(self, font, color, shadow_offset):
+        revealed = self.round.revealed
+        if len(revealed) <= GLYPH_LINE_LENGTH:
+            # Short words: one render of the whole line
+            self.cell_width = 0
+            self.surface = render_shadowed(" ".join(revealed) + " ", font, color, shadow_offset)
+            return
+        
+        # Long phrases: fixed-width cells filled from per-glyph surfaces
+        space = font.size(" ")[0]
+        self.cell_width = max(font.size(glyph)[0] for glyph in set(self.round.word) | {"_"}) + space
+        height = font.get_linesize() + abs(shadow_offset[1])
+        self.surface = pygame.Surface((self.cell_width * len(revealed) + abs(shadow_offset[0]), height), pygame.SRCALPHA)
+        for position, glyph in enumerate(revealed):
+            self.blit_glyph(position, glyph, font, color, shadow_offset)
+    
+    def reveal(self, font, color, shadow_offset):
+        """Replace the blanks of letters guessed since the last refresh"""
+        for letter in self.round.guessed_letters[self.guess_count:]:
+            for position in self.round.positions.get(letter, ()):
+                self.blit_glyph(position, letter, font, color, shadow_offset)
+    
+    def blit_glyph(self, position, glyph, font, color, shadow_offset):
+        cell = pygame.Rect(position * self.cell_width, 0, self.cell_width, self.surface.get_height())
+        self.surface.fill((0, 0, 0, 0), cell)
+        glyph_surface = text_cache.render(glyph, font, color, shadow_offset)
+        self.surface.blit(glyph_surface, (cell.x + (self.cell_width - glyph_surface.get_width()) // 2, 0))
+    
+    def get_rect(self, shadow_offset, **anchor):
+        """Return the area the line covers; the anchor positions the text, as in blit_text"""
+        dx, dy = shadow_offset
+        text_rect = pygame.Rect(0, 0, self.surface.get_width() - abs(dx), self.surface.get_height() - abs(dy))
+        for name, value in anchor.items():
+            setattr(text_rect, name, value)
+        return self.surface.get_rect(topleft=(text_rect.x - max(-dx, 0), text_rect.y - max(-dy, 0)))
+    
+    def draw(self, surface, hangman_round, font, color, shadow_offset, **anchor):
+        self.refresh(hangman_round, font, color, shadow_offset)
+        rect = self.get_rect(shadow_offset, **anchor)
+        surface.blit(self.surface, rect)
+        return rect
 
 # Sound effects
 def create_beep_sound(frequency, duration, volume=0.3):
     """Create a simple beep sound with the given frequency and duration"""
-    sample_rate = 44100
-    n_samples = int(round(duration * sample_rate))
-    
-    # Generate a numpy array of sound samples
-    buf = pygame.mixer.Sound(buffer=bytes(bytearray(
-        int(32767.0 * volume * math.sin(2.0 * math.pi * frequency * i / sample_rate))
-        & 0xFF for i in range(n_samples)
-    )))
-    return buf
-
-# Create sound effects
-correct_sound = create_beep_sound(440, 0.2)  # Higher pitched beep for correct guess
-wrong_sound = create_beep_sound(220, 0.3)    # Lower pitched beep for wrong guess
-win_sound = create_beep_sound(880, 0.5)      # High pitched beep for win
-lose_sound = create_beep_sound(110, 0.7)     # Low pitched beep for lose
-click_sound = create_beep_sound(660, 0.1)    # Medium pitched short beep for clicks
-# Game data - categorized by difficulty
-categories = {
-    "Animals": {
-        "easy": ["dog", "cat", "pig", "fox", "cow", "rat", "bat", "hen", "bee", "ant"],
-        "medium": ["tiger", "zebra", "koala", "panda", "camel", "eagle", "shark", "snake", "horse", "sheep"],
-        "hard": ["elephant", "giraffe", "penguin", "kangaroo", "dolphin", "rhinoceros", "crocodile", "octopus", "cheetah", "panther"]
-    },
-    "Movies": {
-        "easy": ["jaws", "star", "cars", "up", "toy", "lion", "wall", "bolt", "soul", "nemo"],
-        "medium": ["frozen", "avatar", "matrix", "aliens", "psycho", "shrek", "titanic", "batman", "joker", "rocky"],
-        "hard": ["inception", "gladiator", "interstellar", "casablanca", "godfather", "parasite", "whiplash", "braveheart", "goodfellas", "apocalypse"]
-    },
-    "Countries": {
-        "easy": ["usa", "cuba", "peru", "mali", "fiji", "iran", "iraq", "chad", "togo", "laos"],
-        "medium": ["japan", "india", "china", "spain", "italy", "kenya", "egypt", "chile", "sudan", "nepal"],
-        "hard": ["australia", "argentina", "singapore", "switzerland", "kazakhstan", "mozambique", "bangladesh", "madagascar", "azerbaijan", "kyrgyzstan"]
-    },
-    "Sports": {
-        "easy": ["golf", "swim", "run", "ski", "surf", "bike", "judo", "yoga", "polo", "bowl"],
-        "medium": ["soccer", "tennis", "hockey", "boxing", "karate", "rowing", "diving", "cricket", "cycling", "fencing"],
-        "hard": ["basketball", "volleyball", "gymnastics", "wrestling", "badminton", "skateboard", "snowboard", "waterpolo", "taekwondo", "equestrian"]
-    },
-    "Fruits": {
-        "easy": ["pear", "plum", "lime", "kiwi", "fig", "date", "apple", "grape", "melon", "mango"],
-        "medium": ["orange", "banana", "cherry", "papaya", "guava", "lychee", "apricot", "peach", "lemon", "coconut"],
-        "hard": ["pineapple", "watermelon", "strawberry", "blueberry", "blackberry", "raspberry", "cranberry", "dragonfruit", "passionfruit", "pomegranate"]
-    },
-    "Cars": {
-        "easy": ["ford", "audi", "jeep", "kia", "mini", "seat", "fiat", "bmw", "saab", "opel"],
-        "medium": ["toyota", "nissan", "honda", "mazda", "subaru", "volvo", "lexus", "jaguar", "tesla", "porsche"],
-        "hard": ["mercedes", "lamborghini", "maserati", "bentley", "ferrari", "bugatti", "chevrolet", "mitsubishi", "volkswagen", "rolls-royce"]
-    }
-}
+    # Samples match the mixer's actual format and are cached on disk
+    return pygame.mixer.Sound(buffer=beep_bytes(frequency, duration, volume, pygame.mixer.get_init()))
+
+# Sound effects (created by init_game)
+correct_sound = None
+wrong_sound = None
+win_sound = None
+lose_sound = None
+click_sound = None
+
+def load_sounds():
+    """Create the sound effects"""
+    global correct_sound, wrong_sound, win_sound, lose_sound, click_sound
+    correct_sound = create_beep_sound(440, 0.2)  # Higher pitched beep for correct guess
+    wrong_sound = create_beep_sound(220, 0.3)    # Lower pitched beep for wrong guess
+    win_sound = create_beep_sound(880, 0.5)      # High pitched beep for win
+    lose_sound = create_beep_sound(110, 0.7)     # Low pitched beep for lose
+    click_sound = create_beep_sound(660, 0.1)    # Medium pitched short beep for clicks
+
+def init_game():
+    """Initialize pygame, open the window and load fonts, images and sounds"""
+    global pygame, screen, clock, SCREEN_WIDTH, SCREEN_HEIGHT
+    if screen is not None:
+        return
+    
+    # Initialize pygame
+    import pygame
+    pygame.init()
+    pygame.mixer.init()  # For sound effects
+    
+    # Get the user's screen resolution
+    info = pygame.display.Info()
+    SCREEN_WIDTH = info.current_w
+    SCREEN_HEIGHT = info.current_h
+    
+    # Create the screen - start in windowed mode
+    screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT), pygame.RESIZABLE)
+    pygame.display.set_caption(GAME_TITLE)
+    clock = pygame.time.Clock()
+    scale_context.update(screen.get_size())
+    
+    # Keep unused event types (text input, joystick, window focus...) off the queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([getattr(pygame, name) for name in ALLOWED_EVENTS])
+    
+    load_background()
+    load_fonts()
+    load_sounds()
+# Word corpus pack - used instead of the built-in word lists when present
+CORPUS_PATH = os.environ.get("HANGMAN_CORPUS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "words.hgc"))
+
+def load_word_lists():
+    """Open the installed corpus pack, falling back to the built-in words"""
+    if os.path.exists(CORPUS_PATH):
+        try:
+            return Corpus(CORPUS_PATH)
+        except (OSError, ValueError) as error:
+            print(f"Could not load word corpus from {CORPUS_PATH}: {error}")
+    return categories
+
+class ButtonSprites:
+    """Pre-rendered button images, one per look, rebuilt for each scale generation"""
+    
+    def __init__(self):
+        self.sprites = {}
+        self.generation = None
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, button, click_level):
+        if self.generation != scale_context.generation:
+            # Sizes, borders and fonts all changed
+            self.generation = scale_context.generation
+            self.sprites.clear()
+        font = button.font_func()
+        hovered = button.is_hovered and not button.is_disabled
+        key = (button.text, button.rect.size, font_manager.key_of(font), button.color, button.hover_color,
+               button.text_color, hovered, button.is_disabled, click_level)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            self.misses += 1
+            sprite = self.sprites[key] = button.render_sprite(font, click_level)
+        else:
+            self.hits += 1
+        return sprite
+    
+    def stats(self):
+        """Return sprite hit/miss counts"""
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self.sprites)}
+
+button_sprites = ButtonSprites()
+
+class HitGrid:
+    """Buttons bucketed into grid cells, so a point is tested against one cell's buttons"""
+    
+    CELL_SIZE = 64
+    
+    def __init__(self, buttons):
+        self.cells = {}
+        for button in buttons:
+            rect = button.rect
+            for cell_x in range(rect.left // self.CELL_SIZE, (rect.right - 1) // self.CELL_SIZE + 1):
+                for cell_y in range(rect.top // self.CELL_SIZE, (rect.bottom - 1) // self.CELL_SIZE + 1):
+                    self.cells.setdefault((cell_x, cell_y), []).append(button)
+    
+    def hit(self, pos):
+        """Return the button at pos, or None"""
+        for button in self.cells.get((pos[0] // self.CELL_SIZE, pos[1] // self.CELL_SIZE), ()):
+            if button.rect.collidepoint(pos):
+                return button
+        return None
+
+# Function to return a width that fits every button label (and any extra
+# texts the buttons may switch to), in pixels for the current scale
+def measured_width(buttons, min_width, padding=40, extra_texts=()):
+    width = scale_x(min_width)
+    for button in buttons:
+        width = max(width, button.font_func().size(button.text)[0] + scale_x(padding))
+    for text in extra_texts:
+        width = max(width, buttons[0].font_func().size(text)[0] + scale_x(padding))
+    return width
+
+# Layout placements. Positions and sizes are in the 800x600 design space and
+# are scaled when the layout is resolved; a width of None means "fit the labels".
+
+class Stack:
+    """Equal-width buttons in a column centered on the screen"""
+    
+    def __init__(self, buttons, top, step, height, min_width, extra_texts=()):
+        self.buttons = buttons
+        self.top = top
+        self.step = step
+        self.height = height
+        self.min_width = min_width
+        self.extra_texts = extra_texts
+    
+    def place(self):
+        width = measured_width(self.buttons, self.min_width, extra_texts=self.extra_texts)
+        for i, button in enumerate(self.buttons):
+            rect = pygame.Rect(0, scale_y(self.top + i * self.step), width, scale_y(self.height))
+            rect.centerx = scale_x(DEFAULT_WIDTH // 2)
+            button.place(rect)
+
+class Row:
+    """Equal-width buttons side by side, centered on the screen"""
+    
+    def __init__(self, buttons, y, height, width=None, gap=6, min_width=120):
+        self.buttons = buttons
+        self.y = y
+        self.height = height
+        self.width = width
+        self.gap = gap
+        self.min_width = min_width
+    
+    def place(self):
+        width = scale_x(self.width) if self.width else measured_width(self.buttons, self.min_width)
+        gap = scale_x(self.gap)
+        left = scale_x(DEFAULT_WIDTH // 2) - (width * len(self.buttons) + gap * (len(self.buttons) - 1)) // 2
+        for i, button in enumerate(self.buttons):
+            button.place(pygame.Rect(left + i * (width + gap), scale_y(self.y), width, scale_y(self.height)))
+
+class Grid:
+    """Equal-width buttons in centered rows, with columns added when the rows would pass bottom
+    and pages added when the columns would get narrower than min_cell_width"""
+    
+    def __init__(self, buttons, top, bottom, row_step, height, min_width, columns=2, gap=30, margin=40,
+                 min_cell_width=110):
+        self.buttons = buttons
+        self.top = top
+        self.bottom = bottom
+        self.row_step = row_step
+        self.height = height
+        self.min_width = min_width
+        self.columns = columns
+        self.gap = gap
+        self.margin = margin
+        self.min_cell_width = min_cell_width
+        self.page = 0
+        self.pages = 1
+        self.shown = buttons  # Buttons on the current page
+    
+    def place(self):
+        if not self.buttons:
+            return
+        rows = max(1, (self.bottom - self.top - self.height) // self.row_step + 1)
+        gap = scale_x(self.gap)
+        available = scale_x(DEFAULT_WIDTH - 2 * self.margin)
+        max_columns = max(1, (available + gap) // (scale_x(self.min_cell_width) + gap))
+        columns = max(self.columns, math.ceil(len(self.buttons) / rows))
+        columns = min(columns, len(self.buttons), max_columns)
+        
+        # Whatever does not fit goes on further pages
+        per_page = rows * columns
+        self.pages = math.ceil(len(self.buttons) / per_page)
+        self.page = min(self.page, self.pages - 1)
+        self.shown = self.buttons[self.page * per_page:(self.page + 1) * per_page]
+        
+        # Shrink the columns if the labels would not fit across the screen
+        max_width = (available - gap * (columns - 1)) // columns
+        width = min(measured_width(self.buttons, self.min_width), max_width)
+        left = scale_x(DEFAULT_WIDTH // 2) - (width * columns + gap * (columns - 1)) // 2
+        for i, button in enumerate(self.shown):
+            row, column = divmod(i, columns)
+            button.place(pygame.Rect(left + column * (width + gap), scale_y(self.top + row * self.row_step),
+                                     width, scale_y(self.height)))
+    
+    def turn_page(self, step):
+        """Show the next (step=1) or previous (step=-1) page, wrapping around"""
+        self.page = (self.page + step) % self.pages
+        self.place()
+
+class Anchor:
+    """One button at a fixed position"""
+    
+    def __init__(self, button, x, y, height, width=None, min_width=100):
+        self.button = button
+        self.x = x
+        self.y = y
+        self.height = height
+        self.width = width
+        self.min_width = min_width
+    
+    def place(self):
+        width = scale_x(self.width) if self.width else measured_width([self.button], self.min_width)
+        self.button.place(pygame.Rect(scale_x(self.x), scale_y(self.y), width, scale_y(self.height)))
+
+class Layout:
+    """The placements of one screen, resolved together once per scale generation"""
+    
+    def __init__(self, *placements):
+        self.placements = placements
+        self.generation = None
+    
+    def resolve(self):
+        """Place the buttons if the scale changed since the last call; returns True if it did"""
+        if self.generation == scale_context.generation:
+            return False
+        self.generation = scale_context.generation
+        for placement in self.placements:
+            placement.place()
+        return True
+
+# Function to draw a row of buttons with one batched blit call
+def draw_buttons(surface, buttons):
+    surface.blits([button.sprite_blit() for button in buttons], doreturn=False)
 
 # Game states
 STATE_MENU = 0
@@ -456,17 +1162,9 @@ STATE_WIN = 4
 STATE_LOSE = 5
 STATE_PAUSE = 6  # New pause state
 
-# Difficulty levels
-DIFFICULTY_EASY = 0
-DIFFICULTY_MEDIUM = 1
-DIFFICULTY_HARD = 2
 
 class Button:
-    def __init__(self, x, y, width, height, text, color, hover_color, text_color=BUTTON_TEXT, font_func=get_medium_font, button_type="default"):
-        self.base_x = x  # Store original positions for scaling
-        self.base_y = y
-        self.base_width = width
-        self.base_height = height
+    def __init__(self, text, color, hover_color, text_color=BUTTON_TEXT, font_func=get_medium_font, button_type="default"):
         self.text = text
         self.button_type = button_type
         
@@ -490,20 +1188,22 @@ class Button:
         self.is_disabled = False
         self.click_effect = 0  # For click animation
         
-        # Update the rect based on current scale
-        self.update_rect()
+        # Screen geometry, set by the screen's layout
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.paint_rect = pygame.Rect(0, 0, 0, 0)
     
-    def update_rect(self):
-        """Update button rectangle based on current screen scale"""
-        x = scale_x(self.base_x)
-        y = scale_y(self.base_y)
-        width = scale_x(self.base_width)
-        height = scale_y(self.base_height)
-        self.rect = pygame.Rect(x, y, width, height)
-        
-    def draw(self, surface):
-        # Update rect in case screen has been resized
-        self.update_rect()
+    def place(self, rect):
+        """Set the button's rect and the area it paints, including shadow and glow"""
+        self.rect = rect
+        shadow_rect = rect.move(scale_x(4), scale_y(4))
+        self.paint_rect = rect.inflate(scale_x(4) + 2, scale_y(4) + 2).union(shadow_rect)
+        
+    def render_sprite(self, font, click_level):
+        """Draw the button as it looks now onto a new colorkeyed surface"""
+        bounds = self.bounds()
+        sprite = pygame.Surface(bounds.size).convert()
+        sprite.fill(LAYER_COLORKEY)
+        rect = self.rect.move(-bounds.x, -bounds.y)
         
         # Determine button color based on state
         if self.is_disabled:
@@ -511,70 +1211,171 @@ class Button:
         else:
             color = self.hover_color if self.is_hovered else self.color
         
-        # Create button shadow for depth
-        shadow_rect = self.rect.copy()
+        # Create button shadow for depth (colors are opaque on the sprite, as on the screen)
+        shadow_rect = rect.copy()
         shadow_rect.x += scale_x(4)
         shadow_rect.y += scale_y(4)
-        pygame.draw.rect(surface, (0, 0, 0, 128), shadow_rect, border_radius=scale_y(15))
+        pygame.draw.rect(sprite, BLACK, shadow_rect, border_radius=scale_y(15))
         
         # Draw button with rounded corners
-        pygame.draw.rect(surface, color, self.rect, border_radius=scale_y(15))
+        pygame.draw.rect(sprite, color, rect, border_radius=scale_y(15))
         
         # Add a glowing border effect when hovered
         if self.is_hovered and not self.is_disabled:
-            glow_rect = self.rect.copy()
+            glow_rect = rect.copy()
             glow_rect.inflate_ip(scale_x(4), scale_y(4))
-            pygame.draw.rect(surface, NEON_YELLOW, glow_rect, scale_y(3), border_radius=scale_y(17))
+            pygame.draw.rect(sprite, NEON_YELLOW, glow_rect, scale_y(3), border_radius=scale_y(17))
         else:
             # Regular border
-            pygame.draw.rect(surface, (255, 255, 255, 150), self.rect, scale_y(2), border_radius=scale_y(15))
+            pygame.draw.rect(sprite, WHITE, rect, scale_y(2), border_radius=scale_y(15))
         
         # Click animation effect
-        if self.click_effect > 0:
-            click_rect = self.rect.copy()
-            click_rect.inflate_ip(-self.click_effect * scale_x(4), -self.click_effect * scale_y(4))
-            pygame.draw.rect(surface, (255, 255, 255, 100), click_rect, border_radius=scale_y(15))
-            self.click_effect -= 0.2
-            if self.click_effect <= 0:
-                self.click_effect = 0
+        if click_level > 0:
+            click_rect = rect.copy()
+            click_rect.inflate_ip(-click_level * scale_x(4), -click_level * scale_y(4))
+            pygame.draw.rect(sprite, WHITE, click_rect, border_radius=scale_y(15))
         
         # Render text with slight offset for pressed effect when clicked
         # Add text shadow for better visibility
-        font = self.font_func()
         shadow_offset = scale_y(1)
-        text_shadow = font.render(self.text, True, BLACK)
-        text_shadow_rect = text_shadow.get_rect(center=self.rect.center)
-        text_shadow_rect.x += shadow_offset
-        text_shadow_rect.y += shadow_offset
-        
+        text_center = rect.center
+        if click_level > 0:
+            text_center = (text_center[0], text_center[1] + scale_y(2))  # Move text down slightly when clicked
+        
+        text_color = self.text_color if not self.is_disabled else (100, 100, 100)
+        blit_text(sprite, self.text, font, text_color, (shadow_offset, shadow_offset), center=text_center)
+        sprite.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+        return sprite
+    
+    def sprite_blit(self):
+        """Return (sprite, position) for the button's current look"""
+        # The click flash is baked in whole steps
+        click_level = math.ceil(self.click_effect)
+        return button_sprites.get(self, click_level), self.paint_rect.topleft
+    
+    def update(self, dt):
+        """Fade the click animation"""
         if self.click_effect > 0:
-            text_shadow_rect.y += scale_y(2)  # Move shadow down slightly when clicked
-        
-        surface.blit(text_shadow, text_shadow_rect)
-        
-        # Render main text
-        text_surface = font.render(self.text, True, self.text_color if not self.is_disabled else (100, 100, 100))
-        text_rect = text_surface.get_rect(center=self.rect.center)
+            self.click_effect -= 0.2 * dt * ANIMATION_RATE
+            if self.click_effect <= 0:
+                self.click_effect = 0
+    
+    def draw(self, surface):
+        surface.blit(*self.sprite_blit())
         
-        if self.click_effect > 0:
-            text_rect.y += scale_y(2)  # Move text down slightly when clicked
-            
-        surface.blit(text_surface, text_rect)
+    def look(self):
+        """Return the state that decides how the button is drawn"""
+        return (self.text, self.is_hovered, self.is_disabled, self.color, self.text_color, self.click_effect)
+    
+    def bounds(self):
+        """Return the area the button paints, including shadow and glow"""
+        return self.paint_rect
+        
+    def press(self):
+        """Start the click animation and sound"""
+        self.click_effect = 5  # Start click animation
+        click_sound.play()  # Play click sound
+
+# Samples per second in the precomputed pendulum swing
+SWING_TABLE_RATE = 120
+
+# (max angle, duration) -> swing angle per sample
+swing_tables = {}
+
+# Function to return the damped swing angles, sampled once per swing shape
+def swing_table(max_angle, duration):
+    table = swing_tables.get((max_angle, duration))
+    if table is None:
+        table = []
+        while True:
+            t = len(table) / SWING_TABLE_RATE
+            # Calculate swing angle using damped harmonic motion
+            # A * e^(-damping * t) * cos(frequency * t)
+            damping_factor = math.exp(-1.5 * t / duration)
+            # The swing ends when the amplitude becomes very small
+            if damping_factor < 0.05:
+                break
+            table.append(max_angle * damping_factor * math.cos(4 * t))
+        swing_tables[(max_angle, duration)] = table
+    return table
+
+class SwingPoses:
+    """Screen coordinates of the swinging figure per swing angle, kept for one scale generation"""
+    
+    def __init__(self):
+        self.poses = {}
+        self.swing_bounds = {}  # (first angle, samples, pivot) -> Rect
+        self.generation = None
+    
+    def check_generation(self):
+        if self.generation != scale_context.generation:
+            self.generation = scale_context.generation
+            self.poses.clear()
+            self.swing_bounds.clear()
+    
+    def bounds(self, angles, pivot):
+        """Return the area covered by the poses for every angle of a swing"""
+        self.check_generation()
+        key = (angles[0], len(angles), pivot)
+        rect = self.swing_bounds.get(key)
+        if rect is None:
+            xs = []
+            ys = []
+            for angle in angles:
+                rope, head, radius, thickness, limbs = self.compute(angle, pivot)
+                for x, y in list(rope) + [point for _, start, end in limbs for point in (start, end)]:
+                    xs.append(x)
+                    ys.append(y)
+                xs.extend((head[0] - radius, head[0] + radius))
+                ys.extend((head[1] - radius, head[1] + radius))
+            rect = pygame.Rect(int(min(xs)), int(min(ys)), int(max(xs) - min(xs)) + 2, int(max(ys) - min(ys)) + 2)
+            rect = self.swing_bounds[key] = rect.inflate(thickness * 2, thickness * 2)
+        return rect
+    
+    def get(self, angle, pivot):
+        """Return (rope, head center, head radius, line thickness, limbs) for an angle
+        and a pivot in design coordinates; limbs are (wrong guesses needed, start, end)"""
+        self.check_generation()
+        pose = self.poses.get((angle, pivot))
+        if pose is None:
+            pose = self.poses[(angle, pivot)] = self.compute(angle, pivot)
+        return pose
+    
+    @staticmethod
+    def compute(angle, pivot):
+        sin_a = math.sin(angle)
+        cos_a = math.cos(angle)
         
-    def check_hover(self, pos):
-        if not self.is_disabled:
-            self.is_hovered = self.rect.collidepoint(pos)
-        else:
-            self.is_hovered = False
-        return self.is_hovered
-        
-    def is_clicked(self, pos, event):
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and not self.is_disabled:
-            if self.rect.collidepoint(pos):
-                self.click_effect = 5  # Start click animation
-                click_sound.play()  # Play click sound
-                return True
-        return False
+        # Head hangs from the pivot (top of rope) on the rope
+        pivot_x, pivot_y = scale_pos(*pivot)
+        rope_length = scale_y(50)  # Length from pivot to head center
+        head_x = pivot_x + rope_length * sin_a
+        head_y = pivot_y + rope_length * cos_a
+        
+        # Body hangs below the head
+        body_length = scale_y(80)
+        body_start = (head_x, head_y + scale_y(30))  # 30 is head radius
+        body_end = (head_x + body_length * sin_a, head_y + scale_y(30) + body_length * cos_a)
+        limbs = [(2, body_start, body_end)]
+        
+        # Arms from the shoulder, 45 degrees either side
+        arm_length = scale_y(40)
+        shoulder = (head_x + scale_y(20) * sin_a, head_y + scale_y(50) * cos_a)
+        for needed, arm_angle in ((3, angle - math.pi / 4), (4, angle + math.pi / 4)):
+            arm_end = (shoulder[0] + arm_length * math.sin(arm_angle), shoulder[1] + arm_length * math.cos(arm_angle))
+            limbs.append((needed, shoulder, arm_end))
+        
+        # Legs from the end of the body, slightly apart
+        leg_length = scale_y(50)
+        for needed, leg_angle in ((5, angle - math.pi / 8), (6, angle + math.pi / 8)):
+            leg_end = (body_end[0] + leg_length * math.sin(leg_angle), body_end[1] + leg_length * math.cos(leg_angle))
+            limbs.append((needed, body_end, leg_end))
+        
+        rope = ((pivot_x, pivot_y), (head_x, head_y))
+        return rope, (int(head_x), int(head_y)), scale_y(30), scale_y(3), limbs
+
+swing_poses = SwingPoses()
+
 class HangmanAnimation:
     def __init__(self):
         # Animation parameters
@@ -637,8 +1438,8 @@ class HangmanAnimation:
         self.swing_angle = self.max_swing_angle  # Start at maximum angle
         self.swing_time = 0
     
-    def update(self):
-        """Update the animation state"""
+    def update(self, dt):
+        """Advance the animation state by dt seconds"""
         # Update part drawing animations
         if self.animating:
             part = self.parts[self.current_part]
@@ -646,7 +1447,7 @@ class HangmanAnimation:
             
             if part["type"] == "line":
                 # For lines, progress from start to end
-                anim_state["progress"] += 0.02
+                anim_state["progress"] += 0.02 * dt * ANIMATION_RATE
                 if anim_state["progress"] >= 1.0:
                     anim_state["progress"] = 1.0
                     anim_state["complete"] = True
@@ -654,25 +1455,28 @@ class HangmanAnimation:
             
             elif part["type"] == "circle":
                 # For circles, progress through the arc
-                anim_state["progress"] += 0.02
+                anim_state["progress"] += 0.02 * dt * ANIMATION_RATE
                 if anim_state["progress"] >= 1.0:
                     anim_state["progress"] = 1.0
                     anim_state["complete"] = True
                     self.animating = False
         
-        # Update pendulum swing animation
+        # Update pendulum swing animation from the sampled swing
         if self.swinging:
-            self.swing_time += 1/60  # Assuming 60 FPS
-            
-            # Calculate swing angle using damped harmonic motion
-            # A * e^(-damping * t) * cos(frequency * t)
-            damping_factor = math.exp(-1.5 * self.swing_time / self.swing_duration)
-            self.swing_angle = self.max_swing_angle * damping_factor * math.cos(4 * self.swing_time)
+            self.swing_time += dt
+            angles = swing_table(self.max_swing_angle, self.swing_duration)
+            index = int(self.swing_time * SWING_TABLE_RATE)
             
             # Stop swinging when amplitude becomes very small
-            if damping_factor < 0.05:
+            if index >= len(angles):
                 self.swinging = False
                 self.swing_angle = 0
+            else:
+                self.swing_angle = angles[index]
+    
+    def has_pending_parts(self, wrong_guesses):
+        """Return True if a visible part has not finished animating"""
+        return any(not self.part_animations[i]["complete"] for i in range(self.scaffold_parts, self.scaffold_parts + min(wrong_guesses, self.wrong_parts)))
     
     def draw(self, surface, wrong_guesses):
         """Draw the hangman with animations"""
@@ -735,84 +1539,161 @@ class HangmanAnimation:
                 # Draw complete circle
                 pygame.draw.circle(surface, BLACK, (center_x, center_y), radius, thickness)
                 
+    def swing_bounds(self):
+        """Return the screen area the swinging figure can reach"""
+        return swing_poses.bounds(swing_table(self.max_swing_angle, self.swing_duration), self.pivot_point)
+    
     def draw_swinging_hangman(self, surface, wrong_guesses):
         """Draw the hangman figure swinging like a pendulum"""
-        # Scale the pivot point
-        pivot_x, pivot_y = scale_pos(self.pivot_point[0], self.pivot_point[1])
-        
-        # Calculate the rope length
-        rope_length = scale_y(50)  # Length from pivot to head center
-        
-        # Calculate the position of the head based on swing angle
-        head_x = pivot_x + rope_length * math.sin(self.swing_angle)
-        head_y = pivot_y + rope_length * math.cos(self.swing_angle)
+        rope, head, radius, thickness, limbs = swing_poses.get(self.swing_angle, self.pivot_point)
         
-        # Draw the rope
-        pygame.draw.line(surface, BLACK, (pivot_x, pivot_y), (head_x, head_y), scale_y(3))
-        
-        # Draw the head (circle)
-        pygame.draw.circle(surface, BLACK, (int(head_x), int(head_y)), scale_y(30), scale_y(3))
+        # Draw the rope and the head (circle)
+        pygame.draw.line(surface, BLACK, rope[0], rope[1], thickness)
+        pygame.draw.circle(surface, BLACK, head, radius, thickness)
         
         # Only draw body parts if they should be visible based on wrong guesses
-        if wrong_guesses >= 2:  # Body
-            body_length = scale_y(80)
-            body_x = head_x
-            body_y = head_y + scale_y(30)  # 30 is head radius
-            body_end_x = head_x + body_length * math.sin(self.swing_angle)
-            body_end_y = head_y + scale_y(30) + body_length * math.cos(self.swing_angle)
-            pygame.draw.line(surface, BLACK, (body_x, body_y), (body_end_x, body_end_y), scale_y(3))
-            
-            if wrong_guesses >= 3:  # Left arm
-                arm_length = scale_y(40)
-                arm_angle = self.swing_angle - math.pi/4  # 45 degrees left
-                arm_x = head_x + scale_y(20) * math.sin(self.swing_angle)  # Offset from body
-                arm_y = head_y + scale_y(50) * math.cos(self.swing_angle)  # Offset from head
-                arm_end_x = arm_x + arm_length * math.sin(arm_angle)
-                arm_end_y = arm_y + arm_length * math.cos(arm_angle)
-                pygame.draw.line(surface, BLACK, (arm_x, arm_y), (arm_end_x, arm_end_y), scale_y(3))
-            
-            if wrong_guesses >= 4:  # Right arm
-                arm_length = scale_y(40)
-                arm_angle = self.swing_angle + math.pi/4  # 45 degrees right
-                arm_x = head_x + scale_y(20) * math.sin(self.swing_angle)  # Offset from body
-                arm_y = head_y + scale_y(50) * math.cos(self.swing_angle)  # Offset from head
-                arm_end_x = arm_x + arm_length * math.sin(arm_angle)
-                arm_end_y = arm_y + arm_length * math.cos(arm_angle)
-                pygame.draw.line(surface, BLACK, (arm_x, arm_y), (arm_end_x, arm_end_y), scale_y(3))
-            
-            if wrong_guesses >= 5:  # Left leg
-                leg_length = scale_y(50)
-                leg_angle = self.swing_angle - math.pi/8  # Slight angle left
-                leg_x = body_end_x
-                leg_y = body_end_y
-                leg_end_x = leg_x + leg_length * math.sin(leg_angle)
-                leg_end_y = leg_y + leg_length * math.cos(leg_angle)
-                pygame.draw.line(surface, BLACK, (leg_x, leg_y), (leg_end_x, leg_end_y), scale_y(3))
-            
-            if wrong_guesses >= 6:  # Right leg
-                leg_length = scale_y(50)
-                leg_angle = self.swing_angle + math.pi/8  # Slight angle right
-                leg_x = body_end_x
-                leg_y = body_end_y
-                leg_end_x = leg_x + leg_length * math.sin(leg_angle)
-                leg_end_y = leg_y + leg_length * math.cos(leg_angle)
-                pygame.draw.line(surface, BLACK, (leg_x, leg_y), (leg_end_x, leg_end_y), scale_y(3))
+        for needed, start, end in limbs:
+            if wrong_guesses >= needed:
+                pygame.draw.line(surface, BLACK, start, end, thickness)
+
+# Names of the pygame event types the game reacts to; everything else is dropped by SDL.
+# MOUSEMOTION only wakes the idle frame scheduler so hover can follow the pointer.
+ALLOWED_EVENTS = [
+    "QUIT",
+    "KEYDOWN",
+    "MOUSEBUTTONDOWN",
+    "MOUSEMOTION",
+    "VIDEORESIZE",
+    "VIDEOEXPOSE",
+    "WINDOWEXPOSED",
+]
+
+# Function to collapse each run of consecutive mouse motion events into its last event
+def coalesce_motion(events):
+    coalesced = []
+    for event in events:
+        if event.type == pygame.MOUSEMOTION and coalesced and coalesced[-1].type == pygame.MOUSEMOTION:
+            coalesced[-1] = event
+        else:
+            coalesced.append(event)
+    return coalesced
+
+class AnimationClock:
+    """The time step shared by every animation: real time, clamped after stalls, or a fixed step.
+    
+    elapsed is the unclamped wall time since the previous frame, for game
+    rules like the round countdown that must follow the real clock.
+    """
+    
+    def __init__(self, fixed_step=FIXED_TIMESTEP, max_step=MAX_FRAME_TIME):
+        self.fixed_step = fixed_step
+        self.max_step = max_step
+        self.last = None
+        self.dt = 0.0       # Animation time step for this frame
+        self.elapsed = 0.0  # Real seconds since the previous frame
+        self.time = 0.0     # Animation time since the clock started
+    
+    def tick(self):
+        """Start a frame and return its time step in seconds"""
+        now = time.perf_counter()
+        self.elapsed = 0.0 if self.last is None else now - self.last
+        self.last = now
+        if self.fixed_step:
+            self.dt = self.fixed_step
+        else:
+            self.dt = min(self.elapsed, self.max_step)
+        self.time += self.dt
+        return self.dt
+
+# Frame scheduler - runs at full rate only while something animates and
+# otherwise sleeps on the event queue, waking as soon as input arrives
+class FrameScheduler:
+    MODE_ACTIVE = "active"  # Animation running - tick at FPS
+    MODE_TIMER = "timer"    # Only the countdown changes - tick at TIMER_FPS
+    MODE_IDLE = "idle"      # Nothing moves - wait for input
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.mode = self.MODE_ACTIVE
+
+    def wait(self, mode):
+        """Sleep until the next frame is due for the given mode; returns the
+        event that ended the sleep, or None"""
+        if mode != self.mode:
+            self.mode = mode
+            if SHOW_FRAME_MODE:
+                pygame.display.set_caption(f"{GAME_TITLE} [{mode}]")
+        
+        if mode == self.MODE_ACTIVE:
+            self.clock.tick(FPS)
+            return None
+        
+        # Block until an event arrives or the frame is due. The event is
+        # handed back for handle_events to process ahead of the queue -
+        # posting it back would put it behind events that came in later
+        timeout = 1000 // TIMER_FPS if mode == self.MODE_TIMER else IDLE_WAIT_MS
+        event = pygame.event.wait(timeout)
+        self.clock.tick()
+        return event if event.type != pygame.NOEVENT else None
+
 class HangmanGame:
     def __init__(self):
+        # Open the window and load assets on first use
+        init_game()
+        
         self.state = STATE_MENU
         self.category = None
-        self.word = ""
-        self.guessed_letters = []
-        self.wrong_guesses = 0
-        self.max_wrong_guesses = 6
+        self.round = HangmanRound("")  # Rules and state of the current round
+        self.word_line = WordLine()    # Rendered masked word
         self.wins = 0
         self.losses = 0
         self.difficulty = DIFFICULTY_EASY
-        self.timer_enabled = False
-        self.timer_start = 0
-        self.timer_duration = 0  # in seconds
-        self.time_remaining = 0
+        self.round_time = 0  # Seconds played in the current round, pauses excluded
         self.previous_state = None  # For pause menu to return to previous state
+        self.evil_mode = False  # Evil mode keeps the word open and dodges guesses
+        self.evil_indexes = {}  # (category, difficulty) -> word index for evil rounds
+        
+        # Word lists - an installed corpus pack or the built-in words
+        self.word_lists = load_word_lists()
+        
+        # Dirty-rectangle rendering state
+        self.drawn_looks = {}        # Widget -> (look, rect) at the last check
+        self.drawn_state = None      # State and scale generation of the last frame
+        self.drawn_generation = None
+        self.force_redraw = True     # Set when the window contents were lost
+        
+        # Adaptive frame rate, and the time step animations advance by
+        self.scheduler = FrameScheduler(clock)
+        self.animation_clock = AnimationClock()
+        
+        # Hit testing for the current screen's buttons
+        self.grid = None
+        self.grid_key = None
+        self.hovered_button = None
+        
+        # Input dispatch: event type -> handler, then per-state key and click handlers
+        self.event_handlers = {
+            pygame.QUIT: self.on_quit,
+            pygame.VIDEOEXPOSE: self.on_expose,
+            pygame.WINDOWEXPOSED: self.on_expose,
+            pygame.VIDEORESIZE: self.on_resize_event,
+            pygame.KEYDOWN: self.on_key,
+            pygame.MOUSEBUTTONDOWN: self.on_click,
+        }
+        self.key_handlers = {
+            STATE_GAME: self.on_game_key,
+        }
+        self.click_handlers = {
+            STATE_MENU: self.on_menu_click,
+            STATE_DIFFICULTY: self.on_difficulty_click,
+            STATE_CATEGORY: self.on_category_click,
+            STATE_GAME: self.on_game_click,
+            STATE_PAUSE: self.on_pause_click,
+            STATE_WIN: self.on_game_over_click,
+            STATE_LOSE: self.on_game_over_click,
+        }
+        # Events taken off the queue and handled after coalescing, last frame and peak
+        self.event_counts = {"received": 0, "handled": 0, "peak": 0}
         
         # Create improved parallax background
         self.parallax_background = ImprovedParallaxBackground()
@@ -820,147 +1701,140 @@ class HangmanGame:
         # Create hangman animation
         self.hangman_animation = HangmanAnimation()
         
-        # Helper function to calculate button width based on text
-        def calculate_button_width(text, font_func, min_width=120, padding=40):
-            font = font_func()
-            text_width = font.size(text)[0]
-            return max(min_width, text_width + padding)
-        
-        # Create menu buttons with dynamic width
-        play_width = calculate_button_width("Play Game", get_medium_font, 200)
-        quit_width = calculate_button_width("Quit", get_medium_font, 200)
-        menu_button_width = max(play_width, quit_width)
-        
+        # Menu buttons
         self.menu_buttons = [
-            Button(DEFAULT_WIDTH//2 - menu_button_width//2, 200, menu_button_width, 60, "Play Game", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
-            Button(DEFAULT_WIDTH//2 - menu_button_width//2, 300, menu_button_width, 60, "Quit", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
+            Button("Play Game", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
+            Button("Quit", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
         ]
         
-        # Create difficulty buttons with dynamic width
-        easy_width = calculate_button_width("Easy", get_medium_font, 200)
-        medium_width = calculate_button_width("Medium", get_medium_font, 200)
-        hard_width = calculate_button_width("Hard", get_medium_font, 200)
-        diff_button_width = max(easy_width, medium_width, hard_width)
-        
+        # Difficulty buttons
         self.difficulty_buttons = [
-            Button(DEFAULT_WIDTH//2 - diff_button_width//2, 150, diff_button_width, 60, "Easy", BUTTON_BG, (100, 255, 100), BUTTON_TEXT, get_medium_font),
-            Button(DEFAULT_WIDTH//2 - diff_button_width//2, 250, diff_button_width, 60, "Medium", BUTTON_BG, (255, 255, 100), BUTTON_TEXT, get_medium_font),
-            Button(DEFAULT_WIDTH//2 - diff_button_width//2, 350, diff_button_width, 60, "Hard", BUTTON_BG, (255, 100, 100), BUTTON_TEXT, get_medium_font)
+            Button("Easy", BUTTON_BG, (100, 255, 100), BUTTON_TEXT, get_medium_font),
+            Button("Medium", BUTTON_BG, (255, 255, 100), BUTTON_TEXT, get_medium_font),
+            Button("Hard", BUTTON_BG, (255, 100, 100), BUTTON_TEXT, get_medium_font)
         ]
         
-        # Create back button for difficulty screen
-        back_width = calculate_button_width("Back", get_medium_font, 100)
-        self.back_button = Button(50, DEFAULT_HEIGHT - 80, back_width, 50, "Back", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
-        
-        # Create category buttons with dynamic width and better spacing
-        category_names = ["Animals", "Movies", "Countries", "Sports", "Fruits", "Cars"]
-        category_widths = [calculate_button_width(name, get_medium_font, 140) for name in category_names]
-        max_category_width = max(category_widths)
-        button_gap = 30  # Gap between buttons
-        
-        # Calculate total width needed for two buttons plus gap
-        total_width = max_category_width * 2 + button_gap
-        left_start = DEFAULT_WIDTH//2 - total_width//2
-        right_start = left_start + max_category_width + button_gap
-        
-        self.category_buttons = [
-            Button(left_start, 120, max_category_width, 50, "Animals", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
-            Button(right_start, 120, max_category_width, 50, "Movies", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
-            Button(left_start, 190, max_category_width, 50, "Countries", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
-            Button(right_start, 190, max_category_width, 50, "Sports", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
-            Button(left_start, 260, max_category_width, 50, "Fruits", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
-            Button(right_start, 260, max_category_width, 50, "Cars", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
+        # Evil mode toggle below the difficulty descriptions
+        self.evil_button = Button("Evil Mode: Off", BUTTON_BG, (160, 80, 160), BUTTON_TEXT, get_small_font)
+        
+        # Back button for the difficulty and category screens
+        self.back_button = Button("Back", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
+        
+        # One button per category in the word lists
+        self.category_buttons = [Button(name, BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
+                                 for name in self.word_lists]
+        self.category_grid = Grid(self.category_buttons, top=120, bottom=DEFAULT_HEIGHT - 90, row_step=70, height=50, min_width=140)
+        
+        # Previous/next page buttons, shown when the categories need more than one page
+        self.page_buttons = [
+            Button("<", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
+            Button(">", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
         ]
         
-        # Create keyboard buttons with better spacing - REDUCED SIZE
-        self.keyboard_buttons = []
-        letters = "abcdefghijklmnopqrstuvwxyz"
-        
-        # Calculate optimal button size based on screen width and font - SMALLER BUTTONS
-        button_width = 35  # Reduced from 45
-        button_height = 35  # Reduced from 45
-        button_margin = 6   # Reduced from 8
-        
-        # First row (a-m) - 13 letters
-        row1_letters = letters[:13]
-        total_row1_width = (button_width + button_margin) * len(row1_letters) - button_margin
-        x_start = (DEFAULT_WIDTH - total_row1_width) // 2
-        y_pos = DEFAULT_HEIGHT - 120  # Moved up more
-        
-        for i, letter in enumerate(row1_letters):
-            x = x_start + i * (button_width + button_margin)
-            self.keyboard_buttons.append(Button(x, y_pos, button_width, button_height, letter, BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_small_font))
-        
-        # Second row (n-z) - 13 letters
-        row2_letters = letters[13:]
-        total_row2_width = (button_width + button_margin) * len(row2_letters) - button_margin
-        x_start = (DEFAULT_WIDTH - total_row2_width) // 2
-        y_pos = DEFAULT_HEIGHT - 75  # Moved up slightly
-        
-        for i, letter in enumerate(row2_letters):
-            x = x_start + i * (button_width + button_margin)
-            self.keyboard_buttons.append(Button(x, y_pos, button_width, button_height, letter, BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_small_font))
-        
-        # Game over buttons with dynamic width
-        play_again_width = calculate_button_width("Play Again", get_medium_font, 140)
-        main_menu_width = calculate_button_width("Main Menu", get_medium_font, 140)
-        game_over_button_width = max(play_again_width, main_menu_width)
-        button_gap = 30  # Gap between buttons
-        
-        # Calculate positions for centered buttons with proper gap
-        total_width = game_over_button_width * 2 + button_gap
-        left_start = DEFAULT_WIDTH//2 - total_width//2
-        right_start = left_start + game_over_button_width + button_gap
+        # On-screen keyboard, a-m on the first row and n-z on the second
+        self.keyboard_buttons = [Button(letter, BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_small_font)
+                                 for letter in "abcdefghijklmnopqrstuvwxyz"]
+        
+        # Letter -> keyboard button, for guesses from either input
+        self.letter_buttons = {button.text: button for button in self.keyboard_buttons}
         
+        # Game over buttons
         self.game_over_buttons = [
-            Button(left_start, DEFAULT_HEIGHT - 100, game_over_button_width, 50, "Play Again", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
-            Button(right_start, DEFAULT_HEIGHT - 100, game_over_button_width, 50, "Main Menu", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
+            Button("Play Again", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font),
+            Button("Main Menu", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
         ]
         
-        # Create pause button for game screen - positioned at bottom left corner
-        self.pause_button = Button(10, DEFAULT_HEIGHT - 50, 40, 40, "||", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
-        
-        # Create pause menu buttons
-        continue_width = calculate_button_width("Continue", get_medium_font, 200)
-        quit_width = calculate_button_width("Quit to Menu", get_medium_font, 200)
-        pause_button_width = max(continue_width, quit_width)
+        # Pause button for the game screen
+        self.pause_button = Button("||", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_medium_font)
         
+        # Pause menu buttons
         self.pause_menu_buttons = [
-            Button(DEFAULT_WIDTH//2 - pause_button_width//2, 200, pause_button_width, 60, "Continue", BUTTON_BG, (100, 255, 100), BUTTON_TEXT, get_medium_font),
-            Button(DEFAULT_WIDTH//2 - pause_button_width//2, 300, pause_button_width, 60, "Quit to Menu", BUTTON_BG, (255, 100, 100), BUTTON_TEXT, get_medium_font)
+            Button("Continue", BUTTON_BG, (100, 255, 100), BUTTON_TEXT, get_medium_font),
+            Button("Quit to Menu", BUTTON_BG, (255, 100, 100), BUTTON_TEXT, get_medium_font)
         ]
         
-        # Add fullscreen toggle button - positioned in bottom right corner
-        self.fullscreen_button = Button(DEFAULT_WIDTH - 50, DEFAULT_HEIGHT - 50, 40, 40, "F", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_small_font)
+        # Fullscreen toggle button
+        self.fullscreen_button = Button("F", BUTTON_BG, (80, 80, 100), BUTTON_TEXT, get_small_font)
+        
+        # Where everything goes, in the 800x600 design space; rects are
+        # resolved once per scale generation
+        self.layouts = {
+            "menu": Layout(
+                Stack(self.menu_buttons, top=200, step=100, height=60, min_width=200),
+            ),
+            "difficulty": Layout(
+                Stack(self.difficulty_buttons, top=150, step=100, height=60, min_width=200),
+                Stack([self.evil_button], top=470, step=0, height=40, min_width=200, extra_texts=["Evil Mode: Off"]),
+            ),
+            "category": Layout(
+                self.category_grid,
+                Anchor(self.page_buttons[0], x=DEFAULT_WIDTH // 2 - 60, y=DEFAULT_HEIGHT - 80, height=50, width=50),
+                Anchor(self.page_buttons[1], x=DEFAULT_WIDTH // 2 + 10, y=DEFAULT_HEIGHT - 80, height=50, width=50),
+            ),
+            "game": Layout(
+                Row(self.keyboard_buttons[:13], y=DEFAULT_HEIGHT - 120, height=35, width=35, gap=6),
+                Row(self.keyboard_buttons[13:], y=DEFAULT_HEIGHT - 75, height=35, width=35, gap=6),
+                Anchor(self.pause_button, x=10, y=DEFAULT_HEIGHT - 50, height=40, width=40),
+            ),
+            "pause": Layout(
+                Stack(self.pause_menu_buttons, top=200, step=100, height=60, min_width=200),
+            ),
+            "game_over": Layout(
+                Row(self.game_over_buttons, y=DEFAULT_HEIGHT - 100, height=50, gap=30, min_width=140),
+            ),
+            "common": Layout(
+                Anchor(self.back_button, x=50, y=DEFAULT_HEIGHT - 80, height=50, min_width=100),
+                Anchor(self.fullscreen_button, x=DEFAULT_WIDTH - 50, y=DEFAULT_HEIGHT - 50, height=40, width=40),
+            ),
+        }
+        self.resolve_layout()
+    
+    def resolve_layout(self):
+        """Place every screen's buttons for the current scale, if not done yet"""
+        for layout in self.layouts.values():
+            layout.resolve()
+    
+    # Round state is owned by the rules engine
+    @property
+    def word(self):
+        return self.round.word
+    
+    @property
+    def guessed_letters(self):
+        return self.round.guessed_letters
+    
+    @property
+    def wrong_guesses(self):
+        return self.round.wrong_guesses
+    
+    @property
+    def max_wrong_guesses(self):
+        return self.round.max_wrong_guesses
+    
+    @property
+    def timer_enabled(self):
+        return self.round.timer_enabled
+    
+    @property
+    def timer_duration(self):
+        return self.round.timer_duration
+    
+    @property
+    def time_remaining(self):
+        return self.round.time_remaining
+    
     def start_new_game(self, category_name):
         self.category = category_name
         
-        # Select word based on difficulty
-        if self.difficulty == DIFFICULTY_EASY:
-            difficulty_key = "easy"
-            self.max_wrong_guesses = 8  # More guesses for easy mode
-            self.timer_enabled = False
-        elif self.difficulty == DIFFICULTY_MEDIUM:
-            difficulty_key = "medium"
-            self.max_wrong_guesses = 6  # Standard guesses for medium
-            self.timer_enabled = True
-            self.timer_duration = 120  # 2 minutes for medium
-        else:  # Hard
-            difficulty_key = "hard"
-            self.max_wrong_guesses = 4  # Fewer guesses for hard mode
-            self.timer_enabled = True
-            self.timer_duration = 60  # 1 minute for hard
-        
-        # Get word from appropriate difficulty level
-        self.word = random.choice(categories[category_name][difficulty_key]).lower()
-        self.guessed_letters = []
-        self.wrong_guesses = 0
+        # Pick a word, lives and time limit for the difficulty
+        if self.evil_mode:
+            self.round = new_evil_round(category_name, self.difficulty, word_lists=self.word_lists, indexes=self.evil_indexes)
+        else:
+            self.round = new_round(category_name, self.difficulty, word_lists=self.word_lists)
         self.state = STATE_GAME
         
         # Start timer if enabled
-        if self.timer_enabled:
-            self.timer_start = time.time()
-            self.time_remaining = self.timer_duration
+        self.round_time = 0
         
         # Reset hangman animation
         self.hangman_animation = HangmanAnimation()
@@ -973,66 +1847,47 @@ class HangmanGame:
             button.text_color = BUTTON_TEXT
     
     def guess_letter(self, letter):
-        if letter not in self.guessed_letters:
-            self.guessed_letters.append(letter)
-            
-            # Update keyboard button color and state
-            for button in self.keyboard_buttons:
-                if button.text == letter:
-                    button.is_disabled = True
-                    if letter in self.word:
-                        button.color = GREEN  # Use NEON_GREEN for correct guesses
-                        button.text_color = BLACK  # Black text on green for better visibility
-                        correct_sound.play()  # Play correct sound
-                    else:
-                        button.color = RED  # Use NEON_RED for wrong guesses
-                        button.text_color = WHITE  # White text on red for better visibility
-                        wrong_sound.play()  # Play wrong sound
-                        self.wrong_guesses += 1
-            
-            # Check if game is lost
-            if self.wrong_guesses >= self.max_wrong_guesses:
-                self.state = STATE_LOSE
-                self.losses += 1
-                lose_sound.play()  # Play lose sound
-            
-            # Check if game is won
-            elif all(letter in self.guessed_letters for letter in self.word):
-                self.state = STATE_WIN
-                self.wins += 1
-                win_sound.play()  # Play win sound
-    def draw_word(self):
-        word_display = ""
-        for letter in self.word:
-            if letter in self.guessed_letters:
-                word_display += letter + " "
-            else:
-                word_display += "_ "
-        
-        # Draw text shadow for better visibility
-        shadow_text = get_large_font().render(word_display, True, BLACK)
-        shadow_rect = shadow_text.get_rect(center=(screen.get_width()//2 + scale_x(2), scale_y(450) + scale_y(2)))
-        screen.blit(shadow_text, shadow_rect)
+        correct = self.round.guess(letter)
+        if correct is None:
+            return
         
-        # Draw the text
-        text = get_large_font().render(word_display, True, NEON_BLUE)
-        text_rect = text.get_rect(center=(screen.get_width()//2, scale_y(450)))
-        screen.blit(text, text_rect)
+        # Update keyboard button color and state
+        button = self.letter_buttons.get(letter)
+        if button is not None:
+            button.is_disabled = True
+            if correct:
+                button.color = GREEN  # Use NEON_GREEN for correct guesses
+                button.text_color = BLACK  # Black text on green for better visibility
+            else:
+                button.color = RED  # Use NEON_RED for wrong guesses
+                button.text_color = WHITE  # White text on red for better visibility
+        if correct:
+            correct_sound.play()  # Play correct sound
+        else:
+            wrong_sound.play()  # Play wrong sound
+        
+        # Check if game is lost
+        if self.round.lost:
+            self.state = STATE_LOSE
+            self.losses += 1
+            lose_sound.play()  # Play lose sound
+        
+        # Check if game is won
+        elif self.round.won:
+            self.state = STATE_WIN
+            self.wins += 1
+            win_sound.play()  # Play win sound
+    def draw_word(self):
+        # Draw the text with a shadow for better visibility
+        self.word_line.draw(screen, self.round, get_large_font(), NEON_BLUE, (scale_x(2), scale_y(2)), center=(screen.get_width()//2, scale_y(450)))
     
     def draw_menu(self):
         # Draw title with shadow for better visibility
         shadow_offset = scale_y(2)
-        title_shadow = get_title_font().render("HANGMAN GAME", True, BLACK)
-        title_shadow_rect = title_shadow.get_rect(center=(screen.get_width()//2 + shadow_offset, scale_y(100) + shadow_offset))
-        screen.blit(title_shadow, title_shadow_rect)
-        
-        title = get_title_font().render("HANGMAN GAME", True, PURPLE)
-        title_rect = title.get_rect(center=(screen.get_width()//2, scale_y(100)))
-        screen.blit(title, title_rect)
+        blit_text(screen, "HANGMAN GAME", get_title_font(), PURPLE, (shadow_offset, shadow_offset), center=(screen.get_width()//2, scale_y(100)))
         
         # Draw buttons
-        for button in self.menu_buttons:
-            button.draw(screen)
+        draw_buttons(screen, self.menu_buttons)
             
         # Draw fullscreen toggle button
         self.fullscreen_button.draw(screen)
@@ -1040,17 +1895,10 @@ class HangmanGame:
     def draw_difficulty_selection(self):
         # Draw title with shadow
         shadow_offset = scale_y(2)
-        title_shadow = get_title_font().render("SELECT DIFFICULTY", True, BLACK)
-        title_shadow_rect = title_shadow.get_rect(center=(screen.get_width()//2 + shadow_offset, scale_y(80) + shadow_offset))
-        screen.blit(title_shadow, title_shadow_rect)
-        
-        title = get_title_font().render("SELECT DIFFICULTY", True, BLUE)
-        title_rect = title.get_rect(center=(screen.get_width()//2, scale_y(80)))
-        screen.blit(title, title_rect)
+        blit_text(screen, "SELECT DIFFICULTY", get_title_font(), BLUE, (shadow_offset, shadow_offset), center=(screen.get_width()//2, scale_y(80)))
         
         # Draw buttons
-        for button in self.difficulty_buttons:
-            button.draw(screen)
+        draw_buttons(screen, self.difficulty_buttons)
             
         # Draw difficulty descriptions with proper spacing
         descriptions = [
@@ -1065,15 +1913,11 @@ class HangmanGame:
             button = self.difficulty_buttons[i]
             button_bottom = button.rect.bottom
             
-            # Add shadow for better visibility
-            desc_shadow = get_small_font().render(desc, True, BLACK)
-            desc_shadow_rect = desc_shadow.get_rect(center=(screen.get_width()//2 + scale_x(1), button_bottom + scale_y(25) + scale_y(1)))
-            screen.blit(desc_shadow, desc_shadow_rect)
-            
-            # Draw the description text with consistent spacing from button
-            desc_text = get_small_font().render(desc, True, WHITE)
-            desc_rect = desc_text.get_rect(center=(screen.get_width()//2, button_bottom + scale_y(25)))
-            screen.blit(desc_text, desc_rect)
+            # Draw the description text with a shadow, consistently spaced from the button
+            blit_text(screen, desc, get_small_font(), WHITE, (scale_x(1), scale_y(1)), center=(screen.get_width()//2, button_bottom + scale_y(25)))
+        
+        # Draw evil mode toggle
+        self.evil_button.draw(screen)
         
         # Draw back button
         self.back_button.draw(screen)
@@ -1084,17 +1928,10 @@ class HangmanGame:
     def draw_category_selection(self):
         # Draw title with shadow
         shadow_offset = scale_y(2)
-        title_shadow = get_title_font().render("SELECT CATEGORY", True, BLACK)
-        title_shadow_rect = title_shadow.get_rect(center=(screen.get_width()//2 + shadow_offset, scale_y(80) + shadow_offset))
-        screen.blit(title_shadow, title_shadow_rect)
-        
-        title = get_title_font().render("SELECT CATEGORY", True, BLUE)
-        title_rect = title.get_rect(center=(screen.get_width()//2, scale_y(80)))
-        screen.blit(title, title_rect)
+        blit_text(screen, "SELECT CATEGORY", get_title_font(), BLUE, (shadow_offset, shadow_offset), center=(screen.get_width()//2, scale_y(80)))
         
         # Draw buttons
-        for button in self.category_buttons:
-            button.draw(screen)
+        draw_buttons(screen, self.category_page_buttons())
         
         # Draw back button
         self.back_button.draw(screen)
@@ -1127,15 +1964,8 @@ class HangmanGame:
             (x + radius * 2, y - radius)
         ]
         pygame.draw.polygon(screen, heart_color, points)
-    def draw_timer(self, x, y):
-        """Draw the timer with a visual representation"""
-        if not self.timer_enabled:
-            return
-            
-        # Scale the position - center horizontally, fixed position vertically
-        x = screen.get_width() // 2
-        y = scale_y(40)
-            
+    def get_timer_look(self):
+        """Return the timer label, color and bar fill width"""
         # Calculate minutes and seconds
         minutes = int(self.time_remaining // 60)
         seconds = int(self.time_remaining % 60)
@@ -1148,9 +1978,24 @@ class HangmanGame:
         else:  # Less than 30% time left
             timer_color = RED
         
+        fill_width = int((self.time_remaining / self.timer_duration) * scale_x(100))
+        return f"{minutes:02d}:{seconds:02d}", timer_color, fill_width
+    
+    def draw_timer(self, x, y):
+        """Draw the timer with a visual representation"""
+        if not self.timer_enabled:
+            return
+            
+        # Scale the position - center horizontally, fixed position vertically
+        x = screen.get_width() // 2
+        y = scale_y(40)
+        
+        timer_label, timer_color = self.get_timer_look()[:2]
+        
         # Create a semi-transparent background for better visibility
-        timer_text = get_medium_font().render(f"{minutes:02d}:{seconds:02d}", True, timer_color)
-        timer_rect = timer_text.get_rect(center=(x, y))
+        font = get_medium_font()
+        timer_rect = pygame.Rect((0, 0), font.size(timer_label))
+        timer_rect.center = (x, y)
         bg_rect = timer_rect.copy()
         bg_rect.inflate_ip(scale_x(20), scale_y(10))
         bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
@@ -1158,12 +2003,7 @@ class HangmanGame:
         screen.blit(bg_surface, bg_rect)
             
         # Draw timer text with shadow for better visibility
-        shadow_text = get_medium_font().render(f"{minutes:02d}:{seconds:02d}", True, BLACK)
-        shadow_rect = shadow_text.get_rect(center=(x + scale_x(2), y + scale_y(2)))
-        screen.blit(shadow_text, shadow_rect)
-        
-        # Draw the main timer text
-        screen.blit(timer_text, timer_rect)
+        blit_text(screen, timer_label, font, timer_color, (scale_x(2), scale_y(2)), center=(x, y))
         
         # Draw a progress bar
         bar_width = scale_x(100)
@@ -1175,7 +2015,7 @@ class HangmanGame:
         pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_width, bar_height))
         
         # Filled portion
-        fill_width = int((self.time_remaining / self.timer_duration) * bar_width)
+        fill_width = self.get_timer_look()[2]
         pygame.draw.rect(screen, timer_color, (bar_x, bar_y, fill_width, bar_height))
         
         # Border
@@ -1183,25 +2023,15 @@ class HangmanGame:
     
     def draw_game_screen(self):
         # Draw category text with shadow for better visibility
-        shadow_text = get_medium_font().render(f"Category: {self.category}", True, BLACK)
-        shadow_rect = shadow_text.get_rect(topleft=(scale_x(22), scale_y(22)))
-        screen.blit(shadow_text, shadow_rect)
-        
-        category_text = get_medium_font().render(f"Category: {self.category}", True, BLUE)
-        category_rect = category_text.get_rect(topleft=(scale_x(20), scale_y(20)))
-        screen.blit(category_text, category_rect)
+        shadow_offset = (scale_x(2), scale_y(2))
+        blit_text(screen, f"Category: {self.category}", get_medium_font(), BLUE, shadow_offset, topleft=(scale_x(20), scale_y(20)))
         
         # Draw difficulty level with shadow
         difficulty_names = ["Easy", "Medium", "Hard"]
         difficulty_colors = [GREEN, YELLOW, RED]
+        evil_label = " (Evil)" if self.evil_mode else ""
         
-        shadow_text = get_small_font().render(f"Difficulty: {difficulty_names[self.difficulty]}", True, BLACK)
-        shadow_rect = shadow_text.get_rect(topleft=(scale_x(22), scale_y(62)))
-        screen.blit(shadow_text, shadow_rect)
-        
-        difficulty_text = get_small_font().render(f"Difficulty: {difficulty_names[self.difficulty]}", True, difficulty_colors[self.difficulty])
-        difficulty_rect = difficulty_text.get_rect(topleft=(scale_x(20), scale_y(60)))
-        screen.blit(difficulty_text, difficulty_rect)
+        blit_text(screen, f"Difficulty: {difficulty_names[self.difficulty]}{evil_label}", get_small_font(), difficulty_colors[self.difficulty], shadow_offset, topleft=(scale_x(20), scale_y(60)))
         
         # Draw hearts for lives - ensure they're visible at the top
         heart_size = scale_y(20)
@@ -1231,13 +2061,7 @@ class HangmanGame:
             self.draw_timer(0, 0)  # Parameters are ignored in the updated method
         
         # Draw stats with shadow - position on right side but below hearts
-        shadow_text = get_small_font().render(f"Wins: {self.wins}  Losses: {self.losses}", True, BLACK)
-        shadow_rect = shadow_text.get_rect(topright=(screen.get_width() - scale_x(18), scale_y(62)))
-        screen.blit(shadow_text, shadow_rect)
-        
-        stats_text = get_small_font().render(f"Wins: {self.wins}  Losses: {self.losses}", True, WHITE)
-        stats_rect = stats_text.get_rect(topright=(screen.get_width() - scale_x(20), scale_y(60)))
-        screen.blit(stats_text, stats_rect)
+        blit_text(screen, f"Wins: {self.wins}  Losses: {self.losses}", get_small_font(), WHITE, shadow_offset, topright=(screen.get_width() - scale_x(20), scale_y(60)))
         
         # Calculate how many parts of the hangman to draw based on wrong guesses and max wrong guesses
         # This ensures the hangman is fully drawn only when all lives are lost
@@ -1250,8 +2074,7 @@ class HangmanGame:
         self.draw_word()
         
         # Draw keyboard (no background)
-        for button in self.keyboard_buttons:
-            button.draw(screen)
+        draw_buttons(screen, self.keyboard_buttons)
         
         # Draw pause button in top-left corner
         self.pause_button.draw(screen)
@@ -1267,26 +2090,13 @@ class HangmanGame:
         
         # Draw pause title with shadow
         shadow_offset = scale_y(3)
-        pause_shadow = get_title_font().render("GAME PAUSED", True, BLACK)
-        pause_shadow_rect = pause_shadow.get_rect(center=(screen.get_width()//2 + shadow_offset, scale_y(150) + shadow_offset))
-        screen.blit(pause_shadow, pause_shadow_rect)
-        
-        pause_text = get_title_font().render("GAME PAUSED", True, NEON_BLUE)
-        pause_rect = pause_text.get_rect(center=(screen.get_width()//2, scale_y(150)))
-        screen.blit(pause_text, pause_rect)
+        blit_text(screen, "GAME PAUSED", get_title_font(), NEON_BLUE, (shadow_offset, shadow_offset), center=(screen.get_width()//2, scale_y(150)))
         
         # Draw keyboard controls hint
-        hint_shadow = get_small_font().render("Tip: You can also use your keyboard to type letters", True, BLACK)
-        hint_shadow_rect = hint_shadow.get_rect(center=(screen.get_width()//2 + scale_x(1), scale_y(400) + scale_y(1)))
-        screen.blit(hint_shadow, hint_shadow_rect)
-        
-        hint_text = get_small_font().render("Tip: You can also use your keyboard to type letters", True, NEON_YELLOW)
-        hint_rect = hint_text.get_rect(center=(screen.get_width()//2, scale_y(400)))
-        screen.blit(hint_text, hint_rect)
+        blit_text(screen, "Tip: You can also use your keyboard to type letters", get_small_font(), NEON_YELLOW, (scale_x(1), scale_y(1)), center=(screen.get_width()//2, scale_y(400)))
         
         # Draw pause menu buttons
-        for button in self.pause_menu_buttons:
-            button.draw(screen)
+        draw_buttons(screen, self.pause_menu_buttons)
             
         # Draw fullscreen toggle button
         self.fullscreen_button.draw(screen)
@@ -1298,46 +2108,22 @@ class HangmanGame:
         
         # Draw win message with shadow
         shadow_offset = scale_y(3)
-        win_shadow = get_title_font().render("YOU WIN!", True, BLACK)
-        win_shadow_rect = win_shadow.get_rect(center=(screen.get_width()//2 + shadow_offset, scale_y(150) + shadow_offset))
-        screen.blit(win_shadow, win_shadow_rect)
-        
-        win_text = get_title_font().render("YOU WIN!", True, NEON_GREEN)
-        win_rect = win_text.get_rect(center=(screen.get_width()//2, scale_y(150)))
-        screen.blit(win_text, win_rect)
+        blit_text(screen, "YOU WIN!", get_title_font(), NEON_GREEN, (shadow_offset, shadow_offset), center=(screen.get_width()//2, scale_y(150)))
         
         # Draw the word
-        word_shadow = get_large_font().render(f"The word was: {self.word}", True, BLACK)
-        word_shadow_rect = word_shadow.get_rect(center=(screen.get_width()//2 + scale_x(2), scale_y(250) + scale_y(2)))
-        screen.blit(word_shadow, word_shadow_rect)
-        
-        word_text = get_large_font().render(f"The word was: {self.word}", True, WHITE)
-        word_rect = word_text.get_rect(center=(screen.get_width()//2, scale_y(250)))
-        screen.blit(word_text, word_rect)
+        blit_text(screen, f"The word was: {self.word}", get_large_font(), WHITE, (scale_x(2), scale_y(2)), center=(screen.get_width()//2, scale_y(250)))
         
         # Draw difficulty
         difficulty_names = ["Easy", "Medium", "Hard"]
+        evil_label = " (Evil)" if self.evil_mode else ""
         
-        diff_shadow = get_medium_font().render(f"Difficulty: {difficulty_names[self.difficulty]}", True, BLACK)
-        diff_shadow_rect = diff_shadow.get_rect(center=(screen.get_width()//2 + scale_x(2), scale_y(290) + scale_y(2)))
-        screen.blit(diff_shadow, diff_shadow_rect)
-        
-        difficulty_text = get_medium_font().render(f"Difficulty: {difficulty_names[self.difficulty]}", True, WHITE)
-        difficulty_rect = difficulty_text.get_rect(center=(screen.get_width()//2, scale_y(290)))
-        screen.blit(difficulty_text, difficulty_rect)
+        blit_text(screen, f"Difficulty: {difficulty_names[self.difficulty]}{evil_label}", get_medium_font(), WHITE, (scale_x(2), scale_y(2)), center=(screen.get_width()//2, scale_y(290)))
         
         # Draw stats
-        stats_shadow = get_medium_font().render(f"Wins: {self.wins}  Losses: {self.losses}", True, BLACK)
-        stats_shadow_rect = stats_shadow.get_rect(center=(screen.get_width()//2 + scale_x(2), scale_y(330) + scale_y(2)))
-        screen.blit(stats_shadow, stats_shadow_rect)
-        
-        stats_text = get_medium_font().render(f"Wins: {self.wins}  Losses: {self.losses}", True, WHITE)
-        stats_rect = stats_text.get_rect(center=(screen.get_width()//2, scale_y(330)))
-        screen.blit(stats_text, stats_rect)
+        blit_text(screen, f"Wins: {self.wins}  Losses: {self.losses}", get_medium_font(), WHITE, (scale_x(2), scale_y(2)), center=(screen.get_width()//2, scale_y(330)))
         
         # Draw buttons
-        for button in self.game_over_buttons:
-            button.draw(screen)
+        draw_buttons(screen, self.game_over_buttons)
             
         # Draw fullscreen toggle button
         self.fullscreen_button.draw(screen)
@@ -1350,255 +2136,426 @@ class HangmanGame:
         
         # Draw lose message with shadow
         shadow_offset = scale_y(3)
-        lose_shadow = get_title_font().render("GAME OVER", True, BLACK)
-        lose_shadow_rect = lose_shadow.get_rect(center=(screen.get_width()//2 + shadow_offset, scale_y(150) + shadow_offset))
-        screen.blit(lose_shadow, lose_shadow_rect)
-        
-        lose_text = get_title_font().render("GAME OVER", True, NEON_RED)
-        lose_rect = lose_text.get_rect(center=(screen.get_width()//2, scale_y(150)))
-        screen.blit(lose_text, lose_rect)
+        blit_text(screen, "GAME OVER", get_title_font(), NEON_RED, (shadow_offset, shadow_offset), center=(screen.get_width()//2, scale_y(150)))
         
         # Draw the word
-        word_shadow = get_large_font().render(f"The word was: {self.word}", True, BLACK)
-        word_shadow_rect = word_shadow.get_rect(center=(screen.get_width()//2 + scale_x(2), scale_y(250) + scale_y(2)))
-        screen.blit(word_shadow, word_shadow_rect)
-        
-        word_text = get_large_font().render(f"The word was: {self.word}", True, WHITE)
-        word_rect = word_text.get_rect(center=(screen.get_width()//2, scale_y(250)))
-        screen.blit(word_text, word_rect)
+        blit_text(screen, f"The word was: {self.word}", get_large_font(), WHITE, (scale_x(2), scale_y(2)), center=(screen.get_width()//2, scale_y(250)))
         
         # Draw difficulty
         difficulty_names = ["Easy", "Medium", "Hard"]
+        evil_label = " (Evil)" if self.evil_mode else ""
         
-        diff_shadow = get_medium_font().render(f"Difficulty: {difficulty_names[self.difficulty]}", True, BLACK)
-        diff_shadow_rect = diff_shadow.get_rect(center=(screen.get_width()//2 + scale_x(2), scale_y(290) + scale_y(2)))
-        screen.blit(diff_shadow, diff_shadow_rect)
-        
-        difficulty_text = get_medium_font().render(f"Difficulty: {difficulty_names[self.difficulty]}", True, WHITE)
-        difficulty_rect = difficulty_text.get_rect(center=(screen.get_width()//2, scale_y(290)))
-        screen.blit(difficulty_text, difficulty_rect)
+        blit_text(screen, f"Difficulty: {difficulty_names[self.difficulty]}{evil_label}", get_medium_font(), WHITE, (scale_x(2), scale_y(2)), center=(screen.get_width()//2, scale_y(290)))
         
         # Draw reason for loss
         if self.timer_enabled and self.time_remaining <= 0:
-            reason_shadow = get_medium_font().render("Time's up!", True, BLACK)
-            reason_shadow_rect = reason_shadow.get_rect(center=(screen.get_width()//2 + scale_x(2), scale_y(330) + scale_y(2)))
-            screen.blit(reason_shadow, reason_shadow_rect)
-            
-            reason_text = get_medium_font().render("Time's up!", True, NEON_RED)
+            reason = "Time's up!"
         else:
-            reason_shadow = get_medium_font().render("Out of lives!", True, BLACK)
-            reason_shadow_rect = reason_shadow.get_rect(center=(screen.get_width()//2 + scale_x(2), scale_y(330) + scale_y(2)))
-            screen.blit(reason_shadow, reason_shadow_rect)
-            
-            reason_text = get_medium_font().render("Out of lives!", True, NEON_RED)
-            
-        reason_rect = reason_text.get_rect(center=(screen.get_width()//2, scale_y(330)))
-        screen.blit(reason_text, reason_rect)
+            reason = "Out of lives!"
+        blit_text(screen, reason, get_medium_font(), NEON_RED, (scale_x(2), scale_y(2)), center=(screen.get_width()//2, scale_y(330)))
         
         # Draw stats
-        stats_shadow = get_medium_font().render(f"Wins: {self.wins}  Losses: {self.losses}", True, BLACK)
-        stats_shadow_rect = stats_shadow.get_rect(center=(screen.get_width()//2 + scale_x(2), scale_y(370) + scale_y(2)))
-        screen.blit(stats_shadow, stats_shadow_rect)
-        
-        stats_text = get_medium_font().render(f"Wins: {self.wins}  Losses: {self.losses}", True, WHITE)
-        stats_rect = stats_text.get_rect(center=(screen.get_width()//2, scale_y(370)))
-        screen.blit(stats_text, stats_rect)
+        blit_text(screen, f"Wins: {self.wins}  Losses: {self.losses}", get_medium_font(), WHITE, (scale_x(2), scale_y(2)), center=(screen.get_width()//2, scale_y(370)))
         
         # Draw buttons
-        for button in self.game_over_buttons:
-            button.draw(screen)
+        draw_buttons(screen, self.game_over_buttons)
             
         # Draw fullscreen toggle button
         self.fullscreen_button.draw(screen)
-    def handle_events(self):
+    
+    def toggle_evil_mode(self):
+        """Switch evil mode on or off for the next rounds"""
+        self.evil_mode = not self.evil_mode
+        self.evil_button.text = "Evil Mode: On" if self.evil_mode else "Evil Mode: Off"
+    
+    def set_display_mode(self, size, flags):
+        """Switch the display mode and refresh size-dependent state"""
+        global screen
+        screen = pygame.display.set_mode(size, flags)
+        self.on_resize()
+    
+    def toggle_fullscreen(self):
+        """Switch between fullscreen and the default window size"""
         global fullscreen
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-                
-            # Handle window resize events
-            if event.type == pygame.VIDEORESIZE:
-                if not fullscreen:  # Only handle resize if not in fullscreen mode
-                    screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-                    # Update parallax background for new screen size
-                    self.parallax_background.resize()
-            
-            # Handle fullscreen toggle button
-            self.fullscreen_button.check_hover(mouse_pos)
-            if self.fullscreen_button.is_clicked(mouse_pos, event):
-                fullscreen = not fullscreen
-                if fullscreen:
-                    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-                else:
-                    screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT), pygame.RESIZABLE)
-                # Update parallax background for new screen size
-                self.parallax_background.resize()
-            
-            # Handle keyboard shortcuts for fullscreen
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_F11 or (event.key == pygame.K_RETURN and pygame.key.get_mods() & pygame.KMOD_ALT):
-                    fullscreen = not fullscreen
-                    if fullscreen:
-                        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
-                    else:
-                        screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT), pygame.RESIZABLE)
-                    # Update parallax background for new screen size
-                    self.parallax_background.resize()
-                elif event.key == pygame.K_ESCAPE:
-                    if fullscreen:
-                        fullscreen = False
-                        screen = pygame.display.set_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT), pygame.RESIZABLE)
-                        # Update parallax background for new screen size
-                        self.parallax_background.resize()
-                    elif self.state == STATE_GAME:
-                        # Pause the game when ESC is pressed during gameplay
-                        self.previous_state = self.state
-                        self.state = STATE_PAUSE
-                # Toggle parallax animation with 'P' key
-                elif event.key == pygame.K_p and self.state != STATE_GAME:
-                    self.parallax_background.toggle()
-                
-                # Handle keyboard letter input during gameplay
-                if self.state == STATE_GAME and event.key >= pygame.K_a and event.key <= pygame.K_z:
-                    letter = chr(event.key)
-                    if letter not in self.guessed_letters:
-                        self.guess_letter(letter)
-            
-            # Menu state
-            if self.state == STATE_MENU:
-                for i, button in enumerate(self.menu_buttons):
-                    button.check_hover(mouse_pos)
-                    if button.is_clicked(mouse_pos, event):
-                        if i == 0:  # Play Game
-                            self.state = STATE_DIFFICULTY
-                        elif i == 1:  # Quit
-                            pygame.quit()
-                            sys.exit()
-            
-            # Difficulty selection state
-            elif self.state == STATE_DIFFICULTY:
-                for i, button in enumerate(self.difficulty_buttons):
-                    button.check_hover(mouse_pos)
-                    if button.is_clicked(mouse_pos, event):
-                        self.difficulty = i  # Set difficulty level
-                        self.state = STATE_CATEGORY
-                
-                # Handle back button
-                self.back_button.check_hover(mouse_pos)
-                if self.back_button.is_clicked(mouse_pos, event):
-                    self.state = STATE_MENU
-            
-            # Category selection state
-            elif self.state == STATE_CATEGORY:
-                for i, button in enumerate(self.category_buttons):
-                    button.check_hover(mouse_pos)
-                    if button.is_clicked(mouse_pos, event):
-                        self.start_new_game(button.text)
-                
-                # Handle back button
-                self.back_button.check_hover(mouse_pos)
-                if self.back_button.is_clicked(mouse_pos, event):
-                    self.state = STATE_DIFFICULTY
-            
-            # Game state
+        fullscreen = not fullscreen
+        if fullscreen:
+            self.set_display_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+        else:
+            self.set_display_mode((DEFAULT_WIDTH, DEFAULT_HEIGHT), pygame.RESIZABLE)
+    
+    def on_resize(self):
+        """Refresh size-dependent state after a resize or fullscreen toggle"""
+        # Recompute scale factors once; caches rebuild on the new generation
+        if scale_context.update(screen.get_size()):
+            # Update parallax background for new screen size
+            self.parallax_background.resize()
+            # Place the buttons for the new scale
+            self.resolve_layout()
+    
+    def hit_grid(self):
+        """Return the hit-test grid for the current screen, rebuilding it on a state or layout change"""
+        key = (self.state, scale_context.generation, self.category_grid.page)
+        if self.grid_key != key:
+            self.grid_key = key
+            buttons = self.screen_buttons(self.state)
+            self.grid = HitGrid(buttons)
+            # Hover flags left over from another screen
+            for button in buttons:
+                button.is_hovered = False
+        return self.grid
+    
+    def update_hover(self, pos):
+        """Move the hover highlight to the enabled button under pos"""
+        button = self.hit_grid().hit(pos)
+        if button is not None and button.is_disabled:
+            button = None
+        if self.hovered_button is not None and self.hovered_button is not button:
+            self.hovered_button.is_hovered = False
+        if button is not None:
+            button.is_hovered = True
+        self.hovered_button = button
+    
+    def clicked_button(self, event):
+        """Return the enabled button a left click landed on, or None"""
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return None
+        button = self.hit_grid().hit(event.pos)
+        if button is None or button.is_disabled:
+            return None
+        button.press()
+        return button
+    
+    def on_quit(self, event):
+        pygame.quit()
+        sys.exit()
+    
+    def on_expose(self, event):
+        # Window contents were lost - repaint everything
+        self.force_redraw = True
+    
+    def on_resize_event(self, event):
+        # Only handle resize if not in fullscreen mode
+        if not fullscreen:
+            self.set_display_mode((event.w, event.h), pygame.RESIZABLE)
+    
+    def on_key(self, event):
+        # Handle keyboard shortcuts for fullscreen
+        if event.key == pygame.K_F11 or (event.key == pygame.K_RETURN and pygame.key.get_mods() & pygame.KMOD_ALT):
+            self.toggle_fullscreen()
+        elif event.key == pygame.K_ESCAPE:
+            if fullscreen:
+                self.toggle_fullscreen()
             elif self.state == STATE_GAME:
-                for button in self.keyboard_buttons:
-                    button.check_hover(mouse_pos)
-                    if button.is_clicked(mouse_pos, event) and button.text not in self.guessed_letters:
-                        self.guess_letter(button.text)
-                
-                # Handle pause button
-                self.pause_button.check_hover(mouse_pos)
-                if self.pause_button.is_clicked(mouse_pos, event):
-                    self.previous_state = self.state
-                    self.state = STATE_PAUSE
-            
-            # Pause state
-            elif self.state == STATE_PAUSE:
-                for i, button in enumerate(self.pause_menu_buttons):
-                    button.check_hover(mouse_pos)
-                    if button.is_clicked(mouse_pos, event):
-                        if i == 0:  # Continue
-                            self.state = self.previous_state
-                        elif i == 1:  # Quit to Menu
-                            self.state = STATE_MENU
-            
-            # Win or Lose state
-            elif self.state == STATE_WIN or self.state == STATE_LOSE:
-                for i, button in enumerate(self.game_over_buttons):
-                    button.check_hover(mouse_pos)
-                    if button.is_clicked(mouse_pos, event):
-                        if i == 0:  # Play Again
-                            self.state = STATE_DIFFICULTY
-                        elif i == 1:  # Main Menu
-                            self.state = STATE_MENU
+                # Pause the game when ESC is pressed during gameplay
+                self.previous_state = self.state
+                self.state = STATE_PAUSE
+        # Toggle parallax animation with 'P' key
+        elif event.key == pygame.K_p and self.state != STATE_GAME:
+            self.parallax_background.toggle()
+        # Toggle pre-rendered parallax layers with 'L' key
+        elif event.key == pygame.K_l and self.state != STATE_GAME:
+            self.parallax_background.toggle_layers()
+        
+        handler = self.key_handlers.get(self.state)
+        if handler is not None:
+            handler(event)
+    
+    def on_click(self, event):
+        clicked = self.clicked_button(event)
+        if clicked is None:
+            return
+        # Handle fullscreen toggle button, shown on every screen
+        if clicked is self.fullscreen_button:
+            self.toggle_fullscreen()
+            return
+        handler = self.click_handlers.get(self.state)
+        if handler is not None:
+            handler(clicked)
+    
+    def on_game_key(self, event):
+        # Handle keyboard letter input during gameplay
+        if event.key >= pygame.K_a and event.key <= pygame.K_z:
+            letter = chr(event.key)
+            if not self.round.has_guessed(letter):
+                self.guess_letter(letter)
+    
+    def on_menu_click(self, clicked):
+        if clicked is self.menu_buttons[0]:  # Play Game
+            self.state = STATE_DIFFICULTY
+        elif clicked is self.menu_buttons[1]:  # Quit
+            pygame.quit()
+            sys.exit()
+    
+    def on_difficulty_click(self, clicked):
+        if clicked in self.difficulty_buttons:
+            self.difficulty = self.difficulty_buttons.index(clicked)  # Set difficulty level
+            self.update_category_buttons()
+            self.state = STATE_CATEGORY
+        # Handle evil mode toggle
+        elif clicked is self.evil_button:
+            self.toggle_evil_mode()
+        # Handle back button
+        elif clicked is self.back_button:
+            self.state = STATE_MENU
+    
+    def update_category_buttons(self):
+        """Disable the categories that have no words for the chosen difficulty"""
+        key = DIFFICULTY_SETTINGS[self.difficulty]["key"]
+        for button in self.category_buttons:
+            button.is_disabled = not self.word_lists[button.text].get(key)
+    
+    def category_page_buttons(self):
+        """Return the category buttons on the current page, plus the page buttons if there are more pages"""
+        if self.category_grid.pages > 1:
+            return self.category_grid.shown + self.page_buttons
+        return self.category_grid.shown
+    
+    def on_category_click(self, clicked):
+        if clicked in self.category_buttons:
+            self.start_new_game(clicked.text)
+        # Handle page buttons
+        elif clicked in self.page_buttons:
+            self.category_grid.turn_page(-1 if clicked is self.page_buttons[0] else 1)
+            self.force_redraw = True
+        # Handle back button
+        elif clicked is self.back_button:
+            self.state = STATE_DIFFICULTY
+    
+    def on_game_click(self, clicked):
+        if self.letter_buttons.get(clicked.text) is clicked:
+            if not self.round.has_guessed(clicked.text):
+                self.guess_letter(clicked.text)
+        # Handle pause button
+        elif clicked is self.pause_button:
+            self.previous_state = self.state
+            self.state = STATE_PAUSE
+    
+    def on_pause_click(self, clicked):
+        if clicked is self.pause_menu_buttons[0]:  # Continue
+            self.state = self.previous_state
+        elif clicked is self.pause_menu_buttons[1]:  # Quit to Menu
+            self.state = STATE_MENU
+    
+    def on_game_over_click(self, clicked):
+        if clicked is self.game_over_buttons[0]:  # Play Again
+            self.state = STATE_DIFFICULTY
+        elif clicked is self.game_over_buttons[1]:  # Main Menu
+            self.state = STATE_MENU
+    
+    def handle_events(self, first_event=None):
+        """Handle this frame's events; first_event is one already taken off the queue"""
+        events = pygame.event.get()
+        if first_event is not None:
+            events.insert(0, first_event)
+        handled = coalesce_motion(events)
+        
+        for event in handled:
+            handler = self.event_handlers.get(event.type)
+            if handler is not None:
+                handler(event)
+        
+        # Hover follows the pointer once per frame, however many events came in
+        self.update_hover(pygame.mouse.get_pos())
+        
+        # Input load for this frame
+        self.event_counts["received"] = len(events)
+        self.event_counts["handled"] = len(handled)
+        self.event_counts["peak"] = max(self.event_counts["peak"], len(events))
     
     def update(self):
         """Update game logic"""
+        dt = self.animation_clock.dt
+        
+        # Fade button click flashes
+        for button in self.screen_buttons(self.state):
+            button.update(dt)
+        
         # Update parallax background if not in game state
         if self.state != STATE_GAME:
-            self.parallax_background.update()
+            self.parallax_background.update(dt)
         
         # Update hangman animation
         if self.state == STATE_GAME:
-            self.hangman_animation.update()
+            self.hangman_animation.update(dt)
             
-            # Update timer if enabled
+            # Update timer if enabled - the countdown follows real time,
+            # not the clamped or fixed animation step
             if self.timer_enabled:
-                elapsed = time.time() - self.timer_start
-                self.time_remaining = max(0, self.timer_duration - elapsed)
+                self.round_time += self.animation_clock.elapsed
+                self.round.update(self.round_time)
                 
                 # Check if time is up
-                if self.time_remaining <= 0:
+                if self.round.timed_out:
                     self.state = STATE_LOSE
                     self.losses += 1
                     lose_sound.play()  # Play lose sound
     
+    def screen_buttons(self, state):
+        """Return the buttons shown on the screen for a state"""
+        if state == STATE_MENU:
+            buttons = self.menu_buttons
+        elif state == STATE_DIFFICULTY:
+            buttons = self.difficulty_buttons + [self.evil_button, self.back_button]
+        elif state == STATE_CATEGORY:
+            buttons = self.category_page_buttons() + [self.back_button]
+        elif state == STATE_GAME:
+            buttons = self.keyboard_buttons + [self.pause_button]
+        elif state == STATE_PAUSE:
+            buttons = self.pause_menu_buttons
+        else:
+            buttons = self.game_over_buttons
+        return buttons + [self.fullscreen_button]
+    
+    def widget_dirty(self, key, look, rect):
+        """Return the area to repaint if a widget's look changed since the last check"""
+        previous = self.drawn_looks.get(key)
+        self.drawn_looks[key] = (look, rect)
+        if previous is None:
+            return rect
+        if previous[0] == look:
+            return None
+        # Cover both the old and the new extent
+        return rect.union(previous[1])
+    
+    def collect_dirty_rects(self):
+        """Return the areas of the current screen whose widgets changed"""
+        rects = []
+        for button in self.screen_buttons(self.state):
+            rects.append(self.widget_dirty(button, button.look(), button.bounds()))
+        
+        if self.state == STATE_GAME:
+            # Timer text and progress bar
+            if self.timer_enabled:
+                timer_look = self.get_timer_look()
+                timer_rect = pygame.Rect((0, 0), get_medium_font().size(timer_look[0]))
+                timer_rect.center = (screen.get_width() // 2, scale_y(40))
+                timer_rect.inflate_ip(scale_x(20) + 4, scale_y(10) + 4)
+                bar_rect = pygame.Rect(0, scale_y(60), scale_x(100), scale_y(10))
+                bar_rect.centerx = screen.get_width() // 2
+                rects.append(self.widget_dirty("timer", timer_look, timer_rect.union(bar_rect.inflate(2, 2))))
+            
+            # Hearts
+            heart_radius = scale_y(20) // 4
+            heart_spacing = scale_x(30)
+            heart_start_x = screen.get_width() - self.max_wrong_guesses * heart_spacing - scale_x(30)
+            hearts_rect = pygame.Rect(heart_start_x - heart_radius * 2, scale_y(30) - heart_radius * 2,
+                                      (self.max_wrong_guesses - 1) * heart_spacing + heart_radius * 4, heart_radius * 4)
+            rects.append(self.widget_dirty("hearts", self.wrong_guesses, hearts_rect.inflate(2, 2)))
+            
+            # Word line - its surface only changes when letters are revealed
+            shadow_offset = (scale_x(2), scale_y(2))
+            self.word_line.refresh(self.round, get_large_font(), NEON_BLUE, shadow_offset)
+            word_rect = self.word_line.get_rect(shadow_offset, center=(screen.get_width() // 2, scale_y(450)))
+            rects.append(self.widget_dirty("word", self.word_line.version, word_rect.inflate(2, 2)))
+            
+            # Hangman figure while it is being drawn or swinging
+            animation = self.hangman_animation
+            hangman_look = (animation.current_part, animation.animating, animation.swing_angle,
+                            tuple(state["progress"] for state in animation.part_animations))
+            hangman_rect = pygame.Rect(scale_pos(100, 80), scale_pos(300, 340)).union(animation.swing_bounds())
+            rects.append(self.widget_dirty("hangman", hangman_look, hangman_rect))
+        
+        return [rect for rect in rects if rect is not None]
+    
+    def needs_full_redraw(self):
+        """Return True if the whole screen must be redrawn and flipped"""
+        full = (not DIRTY_RECTS or self.force_redraw
+                or self.state != self.drawn_state
+                or scale_context.generation != self.drawn_generation
+                # The parallax background moves every frame
+                or (self.state != STATE_GAME and self.parallax_background.active))
+        self.force_redraw = False
+        self.drawn_state = self.state
+        self.drawn_generation = scale_context.generation
+        return full
+    
+    def draw_frame(self):
+        """Draw the background and the current screen"""
+        # Draw background
+        if self.state != STATE_GAME:
+            # Use parallax background for non-game states
+            self.parallax_background.draw(screen)
+        else:
+            # Use static background for game state
+            if has_background:
+                scaled_bg = scale_background()
+                screen.blit(scaled_bg, (0, 0))
+            else:
+                screen.fill(DARK_BG)
+        
+        # Draw current state
+        if self.state == STATE_MENU:
+            self.draw_menu()
+        elif self.state == STATE_DIFFICULTY:
+            self.draw_difficulty_selection()
+        elif self.state == STATE_CATEGORY:
+            self.draw_category_selection()
+        elif self.state == STATE_GAME:
+            self.draw_game_screen()
+        elif self.state == STATE_WIN:
+            self.draw_win_screen()
+        elif self.state == STATE_LOSE:
+            self.draw_lose_screen()
+        elif self.state == STATE_PAUSE:
+            # First draw the game screen (as background)
+            self.draw_game_screen()
+            # Then overlay the pause screen
+            self.draw_pause_screen()
+    
+    def get_frame_mode(self):
+        """Return how fast the next frame needs to come"""
+        # Moving parallax background on the non-game screens
+        if self.state != STATE_GAME and self.parallax_background.active:
+            return FrameScheduler.MODE_ACTIVE
+        
+        # Button click flashes
+        for button in self.screen_buttons(self.state):
+            if button.click_effect > 0:
+                return FrameScheduler.MODE_ACTIVE
+        
+        if self.state == STATE_GAME:
+            # Hangman parts being drawn or the losing swing
+            animation = self.hangman_animation
+            if animation.animating or animation.swinging:
+                return FrameScheduler.MODE_ACTIVE
+            # A part is waiting to start animating on the next draw
+            if animation.has_pending_parts(int(self.wrong_guesses * 6 / self.max_wrong_guesses)):
+                return FrameScheduler.MODE_ACTIVE
+            # Countdown text and bar
+            if self.timer_enabled:
+                return FrameScheduler.MODE_TIMER
+        
+        return FrameScheduler.MODE_IDLE
+    
     def run(self):
+        waking_event = None
         while True:
-            # Handle events
-            self.handle_events()
+            # Time step for this frame's animations
+            self.animation_clock.tick()
+            
+            # Handle events, starting with the one that woke the scheduler
+            self.handle_events(waking_event)
             
             # Update game logic
             self.update()
             
-            # Draw background
-            if self.state != STATE_GAME:
-                # Use parallax background for non-game states
-                self.parallax_background.draw(screen)
-            else:
-                # Use static background for game state
-                if has_background:
-                    scaled_bg = scale_background()
-                    screen.blit(scaled_bg, (0, 0))
-                else:
-                    screen.fill(DARK_BG)
-            
-            # Draw current state
-            if self.state == STATE_MENU:
-                self.draw_menu()
-            elif self.state == STATE_DIFFICULTY:
-                self.draw_difficulty_selection()
-            elif self.state == STATE_CATEGORY:
-                self.draw_category_selection()
-            elif self.state == STATE_GAME:
-                self.draw_game_screen()
-            elif self.state == STATE_WIN:
-                self.draw_win_screen()
-            elif self.state == STATE_LOSE:
-                self.draw_lose_screen()
-            elif self.state == STATE_PAUSE:
-                # First draw the game screen (as background)
-                self.draw_game_screen()
-                # Then overlay the pause screen
-                self.draw_pause_screen()
+            # Redraw everything when the background moves or the screen
+            # changed; otherwise repaint only if a widget changed and
+            # update just those areas of the display
+            dirty_rects = self.collect_dirty_rects()
+            if self.needs_full_redraw():
+                self.draw_frame()
+                pygame.display.flip()
+            elif dirty_rects:
+                # Clip drawing to the changed area so the background and
+                # unchanged widgets are not repainted around it
+                screen.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))
+                self.draw_frame()
+                screen.set_clip(None)
+                pygame.display.update(dirty_rects)
             
-            # Update display
-            pygame.display.flip()
-            clock.tick(FPS)
+            # Full rate while animating, otherwise sleep until input
+            waking_event = self.scheduler.wait(self.get_frame_mode())
 
 # Run the game
 if __name__ == "__main__":
@@ -0,0 +1,242 @@
+"""
+Compiled word corpus for Hangman category packs.
+
+A corpus file keeps every word in one UTF-8 blob, with a table of word
+offsets and a table of buckets. Buckets are sorted by (category, difficulty,
+word length), so all words of a category and difficulty form one contiguous
+run of the offset table. The file is opened with mmap and only the header,
+category names and bucket table are parsed; picking a random word reads two
+offsets and the word bytes, so it is O(1) whatever the size of the pack.
+
+Layout (little-endian):
+    header      magic, category count, bucket count, word count, blob size
+    categories  u16 byte length + UTF-8 name, per category
+    buckets     category id u16, difficulty u8, length u16, first word u32, count u32
+    offsets     word count + 1 u32 offsets into the blob
+    blob        UTF-8 word bytes
+
+Compile plain text lists (one word per line in <source>/<Category>/<difficulty>.txt):
+
+    python hangman_corpus.py compile packs/ words.hgc
+"""
+import argparse
+import mmap
+import os
+import struct
+from collections.abc import Mapping, Sequence
+
+MAGIC = b"HGCORP01"
+HEADER = struct.Struct("<8sIIII")
+NAME_LENGTH = struct.Struct("<H")
+BUCKET = struct.Struct("<HBHII")
+OFFSET = struct.Struct("<I")
+OFFSET_PAIR = struct.Struct("<II")
+
+# Difficulty tags, in the order of the engine's difficulty levels
+DIFFICULTY_KEYS = ["easy", "medium", "hard"]
+
+
+def compile_corpus(word_lists, path):
+    """Write {category: {difficulty: [words]}} to a corpus file"""
+    names = list(word_lists)
+    buckets = []
+    words = []
+    for category_id, name in enumerate(names):
+        for difficulty, key in enumerate(DIFFICULTY_KEYS):
+            by_length = {}
+            for word in dict.fromkeys(word.strip().lower() for word in word_lists[name].get(key, ())):
+                if word:
+                    by_length.setdefault(len(word), []).append(word)
+            for length in sorted(by_length):
+                buckets.append((category_id, difficulty, length, len(words), len(by_length[length])))
+                words.extend(by_length[length])
+
+    encoded = [word.encode("utf-8") for word in words]
+    offsets = [0]
+    for word in encoded:
+        offsets.append(offsets[-1] + len(word))
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as out:
+        out.write(HEADER.pack(MAGIC, len(names), len(buckets), len(words), offsets[-1]))
+        for name in names:
+            encoded_name = name.encode("utf-8")
+            out.write(NAME_LENGTH.pack(len(encoded_name)) + encoded_name)
+        for bucket in buckets:
+            out.write(BUCKET.pack(*bucket))
+        out.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        out.write(b"".join(encoded))
+    os.replace(temp_path, path)
+
+
+def load_text_lists(directory):
+    """Read <directory>/<Category>/<difficulty>.txt word lists"""
+    word_lists = {}
+    for name in sorted(os.listdir(directory)):
+        category_dir = os.path.join(directory, name)
+        if not os.path.isdir(category_dir):
+            continue
+        word_lists[name] = {}
+        for key in DIFFICULTY_KEYS:
+            list_path = os.path.join(category_dir, f"{key}.txt")
+            if os.path.exists(list_path):
+                with open(list_path, encoding="utf-8") as word_file:
+                    word_lists[name][key] = [line.strip() for line in word_file if line.strip()]
+    return word_lists
+
+
+class WordRun(Sequence):
+    """A contiguous run of words in the offset table, read on demand"""
+
+    def __init__(self, corpus, first, count):
+        self.corpus = corpus
+        self.first = first
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("word index out of range")
+        return self.corpus.word_at(self.first + index)
+
+
+class CategoryWords(Mapping):
+    """Difficulty key -> WordRun for one category"""
+
+    def __init__(self, corpus, category_id):
+        self.corpus = corpus
+        self.category_id = category_id
+
+    def __getitem__(self, key):
+        group = None
+        if key in DIFFICULTY_KEYS:
+            group = self.corpus.groups.get((self.category_id, DIFFICULTY_KEYS.index(key)))
+        if group is None:
+            # The pack has no list for this difficulty
+            raise KeyError(key)
+        return WordRun(self.corpus, group[0], group[1])
+
+    def __iter__(self):
+        return iter(key for difficulty, key in enumerate(DIFFICULTY_KEYS)
+                    if (self.category_id, difficulty) in self.corpus.groups)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def by_length(self, key, length):
+        """Return the words of one difficulty with the given length"""
+        bucket = None
+        if key in DIFFICULTY_KEYS:
+            bucket = self.corpus.buckets.get((self.category_id, DIFFICULTY_KEYS.index(key), length))
+        if bucket is None:
+            return WordRun(self.corpus, 0, 0)
+        return WordRun(self.corpus, bucket[0], bucket[1])
+
+
+class Corpus(Mapping):
+    """A memory-mapped corpus file, shaped like the built-in categories dict"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as corpus_file:
+            self.data = mmap.mmap(corpus_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.parse()
+        except ValueError:
+            self.data.close()
+            raise
+
+    def check_size(self, end):
+        """Raise ValueError if the file ends before offset end"""
+        if end > len(self.data):
+            raise ValueError(f"{self.path} is truncated")
+
+    def parse(self):
+        """Read the header, category names and bucket table, validating them
+        against the file size so a corrupt file raises ValueError"""
+        self.check_size(HEADER.size)
+        magic, category_count, bucket_count, self.word_count, self.blob_size = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a Hangman corpus file")
+        position = HEADER.size
+
+        self.names = []
+        for _ in range(category_count):
+            self.check_size(position + NAME_LENGTH.size)
+            (length,) = NAME_LENGTH.unpack_from(self.data, position)
+            position += NAME_LENGTH.size
+            self.check_size(position + length)
+            self.names.append(self.data[position:position + length].decode("utf-8"))
+            position += length
+        self.category_ids = {name: category_id for category_id, name in enumerate(self.names)}
+
+        # (category, difficulty, length) -> (first, count), and the merged
+        # (category, difficulty) runs, which are contiguous by construction
+        self.buckets = {}
+        self.groups = {}
+        self.check_size(position + bucket_count * BUCKET.size)
+        for category_id, difficulty, length, first, count in BUCKET.iter_unpack(self.data[position:position + bucket_count * BUCKET.size]):
+            if category_id >= category_count or difficulty >= len(DIFFICULTY_KEYS) or first + count > self.word_count:
+                raise ValueError(f"{self.path} has a corrupt bucket table")
+            self.buckets[(category_id, difficulty, length)] = (first, count)
+            group_first, group_count = self.groups.get((category_id, difficulty), (first, 0))
+            self.groups[(category_id, difficulty)] = (group_first, group_count + count)
+        position += bucket_count * BUCKET.size
+
+        self.offsets_position = position
+        self.blob_position = position + (self.word_count + 1) * OFFSET.size
+        self.check_size(self.blob_position + self.blob_size)
+
+    def word_at(self, word_id):
+        """Return the word with the given id"""
+        if not 0 <= word_id < self.word_count:
+            raise IndexError("word id out of range")
+        start, end = OFFSET_PAIR.unpack_from(self.data, self.offsets_position + word_id * OFFSET.size)
+        if not start <= end <= self.blob_size:
+            raise ValueError(f"{self.path} has a corrupt offset table")
+        return self.data[self.blob_position + start:self.blob_position + end].decode("utf-8")
+
+    def __getitem__(self, name):
+        return CategoryWords(self, self.category_ids[name])
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    def close(self):
+        self.data.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile or inspect Hangman corpus files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_command = commands.add_parser("compile", help="compile text word lists into a corpus file")
+    compile_command.add_argument("source", help="directory of <Category>/<difficulty>.txt lists")
+    compile_command.add_argument("output", help="corpus file to write")
+    info_command = commands.add_parser("info", help="show the contents of a corpus file")
+    info_command.add_argument("corpus", help="corpus file to read")
+    args = parser.parse_args(argv)
+
+    if args.command == "compile":
+        compile_corpus(load_text_lists(args.source), args.output)
+        print(f"Wrote {args.output}")
+    else:
+        corpus = Corpus(args.corpus)
+        print(f"{corpus.word_count} words in {len(corpus)} categories")
+        for name in corpus:
+            counts = ", ".join(f"{key}: {len(words)}" for key, words in corpus[name].items())
+            print(f"  {name}: {counts}")
+        corpus.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,240 @@
+"""
+Hangman game rules, independent of pygame.
+
+HangmanRound holds the state of one round (word, guesses, lives, timer) and
+decides wins and losses. simulate() plays many rounds headlessly from a seed
+and a guess policy and aggregates the results, which is what we use to tune
+lives and time limits per difficulty.
+"""
+import argparse
+import random
+
+from hangman_words import categories
+
+# Difficulty levels
+DIFFICULTY_EASY = 0
+DIFFICULTY_MEDIUM = 1
+DIFFICULTY_HARD = 2
+
+DIFFICULTY_NAMES = ["Easy", "Medium", "Hard"]
+
+# Per-difficulty settings: word list, lives and time limit in seconds (0 = no timer)
+DIFFICULTY_SETTINGS = {
+    DIFFICULTY_EASY: {"key": "easy", "max_wrong_guesses": 8, "timer_duration": 0},
+    DIFFICULTY_MEDIUM: {"key": "medium", "max_wrong_guesses": 6, "timer_duration": 120},
+    DIFFICULTY_HARD: {"key": "hard", "max_wrong_guesses": 4, "timer_duration": 60},
+}
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
+
+# English letter frequency order, used by the default simulation policy
+FREQUENCY_ORDER = "etaoinshrdlcumwfgypbvkjxqz"
+
+
+# Letter -> bit in the guessed-letter masks. Bits are handed out on first
+# use, so any alphabet (accented letters, CJK characters) works.
+LETTER_BITS = {}
+
+
+def letter_bit(letter):
+    """Return the mask bit for a letter"""
+    bit = LETTER_BITS.get(letter)
+    if bit is None:
+        bit = LETTER_BITS[letter] = 1 << len(LETTER_BITS)
+    return bit
+
+
+class HangmanRound:
+    def __init__(self, word, max_wrong_guesses=6, timer_duration=0):
+        self.max_wrong_guesses = max_wrong_guesses
+        self.timer_duration = timer_duration  # in seconds, 0 = no timer
+        self.time_remaining = timer_duration
+        self.guessed_letters = []  # In guess order
+        self.guessed_mask = 0      # One bit per guessed letter
+        self.wrong_guesses = 0
+        self.won = False
+        self.lost = False
+        self.timed_out = False
+        self.set_word(word)
+
+    def set_word(self, word):
+        """Index a word: where each letter is, and what is still hidden.
+
+        Anything that is not a letter (spaces, hyphens, punctuation) is
+        revealed from the start, so phrases can be won.
+        """
+        self.word = word.lower()
+        self.positions = {}  # Letter -> indexes in the word
+        for position, letter in enumerate(self.word):
+            if letter.isalpha():
+                self.positions.setdefault(letter, []).append(position)
+        self.remaining = {letter for letter in self.positions if not self.has_guessed(letter)}
+        # The word as displayed, "_" for letters not revealed yet
+        self.revealed = ["_" if letter in self.remaining else letter for letter in self.word]
+
+    @property
+    def timer_enabled(self):
+        return self.timer_duration > 0
+
+    @property
+    def is_over(self):
+        return self.won or self.lost
+
+    def has_guessed(self, letter):
+        return bool(self.guessed_mask & letter_bit(letter))
+
+    def guess(self, letter):
+        """Apply a guess; returns True if correct, False if wrong and None if ignored"""
+        bit = letter_bit(letter)
+        if self.is_over or self.guessed_mask & bit:
+            return None
+        self.guessed_mask |= bit
+        self.guessed_letters.append(letter)
+
+        if letter not in self.remaining:
+            self.wrong_guesses += 1
+            # Check if the round is lost
+            if self.wrong_guesses >= self.max_wrong_guesses:
+                self.lost = True
+            return False
+
+        # Reveal the letter and check if the round is won
+        self.remaining.discard(letter)
+        for position in self.positions[letter]:
+            self.revealed[position] = letter
+        if not self.remaining:
+            self.won = True
+        return True
+
+    def update(self, elapsed):
+        """Run the timer forward to elapsed seconds since the round started"""
+        if not self.timer_enabled or self.is_over:
+            return
+        self.time_remaining = max(0, self.timer_duration - elapsed)
+
+        # Check if time is up
+        if self.time_remaining <= 0:
+            self.lost = True
+            self.timed_out = True
+
+
+def new_round(category, difficulty, rng=random, word_lists=categories, settings=DIFFICULTY_SETTINGS):
+    """Start a round with a random word for the category and difficulty"""
+    difficulty_settings = settings[difficulty]
+    word = rng.choice(word_lists[category][difficulty_settings["key"]])
+    return HangmanRound(word, difficulty_settings["max_wrong_guesses"], difficulty_settings["timer_duration"])
+
+
+# Guess policies - called as policy(round, rng) and return the next letter
+
+def frequency_policy(hangman_round, rng):
+    """Guess letters in English frequency order"""
+    for letter in FREQUENCY_ORDER:
+        if not hangman_round.has_guessed(letter):
+            return letter
+
+
+def random_policy(hangman_round, rng):
+    """Guess a random letter that has not been tried yet"""
+    letters = [letter for letter in ALPHABET if not hangman_round.has_guessed(letter)]
+    return rng.choice(letters) if letters else None
+
+
+class SimulationResults:
+    def __init__(self):
+        # (category, difficulty) -> [games, wins, wrong guesses, timeouts]
+        self.groups = {}
+
+    def record(self, category, difficulty, hangman_round):
+        group = self.groups.setdefault((category, difficulty), [0, 0, 0, 0])
+        group[0] += 1
+        group[1] += hangman_round.won
+        group[2] += hangman_round.wrong_guesses
+        group[3] += hangman_round.timed_out
+
+    def totals(self, category=None, difficulty=None):
+        """Return summed [games, wins, wrong guesses, timeouts] for the matching groups"""
+        total = [0, 0, 0, 0]
+        for (group_category, group_difficulty), group in self.groups.items():
+            if category is not None and group_category != category:
+                continue
+            if difficulty is not None and group_difficulty != difficulty:
+                continue
+            total = [a + b for a, b in zip(total, group)]
+        return total
+
+    def win_rate(self, category=None, difficulty=None):
+        games, wins = self.totals(category, difficulty)[:2]
+        return wins / games if games else 0.0
+
+    def mean_wrong_guesses(self, category=None, difficulty=None):
+        games, _, wrong = self.totals(category, difficulty)[:3]
+        return wrong / games if games else 0.0
+
+    def report(self):
+        """Return a text table of win rate and mean wrong guesses per group"""
+        lines = [f"{'Category':<12}{'Difficulty':<12}{'Games':>9}{'Win rate':>10}{'Wrong':>8}{'Timeouts':>10}"]
+        for category, difficulty in sorted(self.groups):
+            games, wins, wrong, timeouts = self.groups[(category, difficulty)]
+            lines.append(f"{category:<12}{DIFFICULTY_NAMES[difficulty]:<12}{games:>9}{wins / games:>10.1%}{wrong / games:>8.2f}{timeouts:>10}")
+        games, wins, wrong, timeouts = self.totals()
+        if games:
+            lines.append(f"{'All':<24}{games:>9}{wins / games:>10.1%}{wrong / games:>8.2f}{timeouts:>10}")
+        return "\n".join(lines)
+
+
+def simulate(n_games, seed=0, policy=frequency_policy, category_names=None, difficulties=None,
+             word_lists=categories, settings=DIFFICULTY_SETTINGS, seconds_per_guess=0):
+    """Play n_games rounds with a guess policy and return the aggregated results.
+
+    Each game picks its category and difficulty at random from the given
+    lists. seconds_per_guess charges the timer for every guess so time
+    limits can be tuned as well as lives.
+    """
+    rng = random.Random(seed)
+    category_names = list(category_names or word_lists)
+    difficulties = list(difficulties if difficulties is not None else settings)
+    results = SimulationResults()
+
+    for _ in range(n_games):
+        category = rng.choice(category_names)
+        difficulty = rng.choice(difficulties)
+        hangman_round = new_round(category, difficulty, rng, word_lists, settings)
+        elapsed = 0
+        while not hangman_round.is_over:
+            letter = policy(hangman_round, rng)
+            if letter is None:
+                # The policy ran out of letters to try
+                hangman_round.lost = True
+                break
+            hangman_round.guess(letter)
+            if seconds_per_guess:
+                elapsed += seconds_per_guess
+                hangman_round.update(elapsed)
+        results.record(category, difficulty, hangman_round)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate Hangman rounds headlessly")
+    parser.add_argument("--games", type=int, default=10000, help="number of rounds to play")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--policy", choices=["frequency", "random", "solver"], default="frequency", help="guess policy")
+    parser.add_argument("--seconds-per-guess", type=float, default=0, help="time charged to the timer per guess")
+    args = parser.parse_args(argv)
+
+    if args.policy == "solver":
+        # Imported here because the solver builds on this module
+        from hangman_solver import WordIndex, solver_policy
+        policy = solver_policy(WordIndex.from_categories(categories))
+    elif args.policy == "random":
+        policy = random_policy
+    else:
+        policy = frequency_policy
+    results = simulate(args.games, args.seed, policy, seconds_per_guess=args.seconds_per_guess)
+    print(results.report())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,264 @@
+"""
+Word difficulty ratings for Hangman.
+
+Every word is rated by how hard it is to solve: a frequency guesser that
+knows the category's word pool (the candidate solver with random tie
+breaks) plays it a few times, and the rating is the mean number of wrong
+guesses it needed. The table also keeps how often the word was solved with
+each difficulty's lives (8/6/4).
+
+Ratings are written to a JSON table keyed by category and word. Each entry
+has a fingerprint of the word and of the pool of same-length words it was
+solved against, so a rerun after the word lists change only rates the new
+entries and the ones whose pool changed. The work is split into chunks and
+spread over all CPU cores with a process pool.
+
+With --compile, each category's rated words are banded by how reliably the
+guesser solves them with each difficulty's lives and written to a corpus file, which the game opens like any other
+pack instead of the hand-sorted lists. The game never reads the JSON table.
+
+    python hangman_ratings.py --output word_ratings.json --compile words.hgc
+    python hangman_ratings.py --corpus words.hgc --output word_ratings.json --compile words.hgc
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from hangman_corpus import Corpus, compile_corpus
+from hangman_engine import DIFFICULTY_SETTINGS, FREQUENCY_ORDER
+from hangman_solver import WordIndex
+from hangman_words import categories
+
+# Bump when the rating method changes so every entry is recomputed
+RATINGS_VERSION = 2
+
+# Games played per word with different tie breaks
+TRIALS = 4
+
+# Words handed to a worker at a time
+CHUNK_SIZE = 256
+
+# Solve rate at which a difficulty's lives count as enough for a word
+SOLVE_THRESHOLD = 0.5
+
+# Lives per difficulty, easiest first
+LIVES = [DIFFICULTY_SETTINGS[difficulty]["max_wrong_guesses"] for difficulty in sorted(DIFFICULTY_SETTINGS)]
+BAND_KEYS = [DIFFICULTY_SETTINGS[difficulty]["key"] for difficulty in sorted(DIFFICULTY_SETTINGS)]
+
+
+def pool_hash(words):
+    """Return a digest of the candidate pool a word is solved against"""
+    return hashlib.sha1("\n".join(sorted(words)).encode("utf-8")).hexdigest()
+
+
+def fingerprint(category, word, pool, trials=TRIALS):
+    """Return the key that decides whether a stored rating is still valid;
+    pool is the pool_hash of the category's words of the same length"""
+    key = repr((RATINGS_VERSION, trials, LIVES, category, word, pool))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def play(index, word, rng):
+    """Solve word with the frequency guesser and return the wrong guesses made"""
+    candidates = index.candidates("_" * len(word))
+    remaining = {letter for letter in word if letter.isalpha()}
+    wrong = 0
+    while remaining:
+        letter = candidates.best_letter(rng)
+        if letter is None:
+            # No candidate fits any more - fall back to frequency order
+            letter = next((letter for letter in FREQUENCY_ORDER if letter not in candidates.guessed), None)
+            if letter is None:
+                return wrong + len(remaining)
+        positions = [position for position, word_letter in enumerate(word) if word_letter == letter]
+        candidates.apply(letter, positions)
+        if positions:
+            remaining.discard(letter)
+        else:
+            wrong += 1
+    return wrong
+
+
+def rate_word(index, category, word, pool, trials=TRIALS):
+    """Return the rating entry for one word"""
+    # Seed from the entry so a word always gets the same rating
+    rng = random.Random(f"{category}:{word}")
+    results = [play(index, word, rng) for _ in range(trials)]
+    return {
+        "fingerprint": fingerprint(category, word, pool, trials),
+        "wrong": sum(results) / trials,
+        "solved": [sum(wrong < lives for wrong in results) / trials for lives in LIVES],
+    }
+
+
+# Per-process state for the pool workers
+_worker_lists = None
+_worker_indexes = {}
+
+
+def _init_worker(source):
+    """Open the word lists once per worker process"""
+    global _worker_lists
+    _worker_lists = Corpus(source) if isinstance(source, str) else source
+    _worker_indexes.clear()
+
+
+def _rate_chunk(category, words, pools, trials):
+    """Rate a chunk of words from one category in a worker; pools maps word length to pool_hash"""
+    index = _worker_indexes.get(category)
+    if index is None:
+        index = _worker_indexes[category] = WordIndex.from_categories(_worker_lists, category)
+    return category, {word: rate_word(index, category, word, pools[len(word)], trials) for word in words}
+
+
+def category_words(word_lists, category):
+    """Return the distinct lowercase words of a category"""
+    return list(dict.fromkeys(word.lower() for words in word_lists[category].values() for word in words))
+
+
+def load_ratings(path):
+    """Read a rating table, or return an empty one if it is missing or unreadable"""
+    try:
+        with open(path, encoding="utf-8") as ratings_file:
+            table = json.load(ratings_file)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(table, dict) or table.get("version") != RATINGS_VERSION:
+        return {}
+    return table.get("categories", {})
+
+
+def save_ratings(ratings, path):
+    """Write a rating table, replacing the old file atomically"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as ratings_file:
+        json.dump({"version": RATINGS_VERSION, "categories": ratings}, ratings_file, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+
+def update_ratings(source, ratings=None, trials=TRIALS, workers=None):
+    """Rate the words of source that are new or changed since ratings.
+
+    source is a {category: {difficulty: [words]}} dict or the path of a corpus
+    file; workers opens a corpus themselves instead of receiving the words.
+    Returns (ratings, number of words rated).
+    """
+    word_lists = Corpus(source) if isinstance(source, str) else source
+    try:
+        return _update_ratings(source, word_lists, ratings, trials, workers)
+    finally:
+        _init_worker(None)
+        if word_lists is not source:
+            word_lists.close()
+
+
+def _update_ratings(source, word_lists, ratings, trials, workers):
+    old_ratings = ratings or {}
+    ratings = {}
+    chunks = []
+    for category in word_lists:
+        old_entries = old_ratings.get(category, {})
+        entries = ratings[category] = {}
+        words = category_words(word_lists, category)
+        # The solver only considers words of the same length, so that is the pool
+        by_length = {}
+        for word in words:
+            by_length.setdefault(len(word), []).append(word)
+        pools = {length: pool_hash(pool) for length, pool in by_length.items()}
+        stale = []
+        for word in words:
+            entry = old_entries.get(word)
+            if entry is not None and entry.get("fingerprint") == fingerprint(category, word, pools[len(word)], trials):
+                entries[word] = entry
+            else:
+                stale.append(word)
+        chunks.extend((category, stale[start:start + CHUNK_SIZE], pools) for start in range(0, len(stale), CHUNK_SIZE))
+
+    rated = sum(len(words) for _, words, _ in chunks)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(chunks) <= 1:
+        _init_worker(word_lists)
+        results = [_rate_chunk(category, words, pools, trials) for category, words, pools in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(source,)) as executor:
+            results = list(executor.map(_rate_chunk, *zip(*chunks), [trials] * len(chunks)))
+    for category, entries in results:
+        ratings[category].update(entries)
+    return ratings, rated
+
+
+def band_of(entry):
+    """Return the band index (0 = easy) for a rating entry.
+
+    A word is easy if the guesser reliably solves it with even the hard
+    difficulty's lives, medium if the medium lives are enough, and hard
+    otherwise.
+    """
+    for band in range(len(LIVES) - 1):
+        # solved is ordered easiest first, so the lives of the hardest
+        # difficulty come last
+        if entry["solved"][len(LIVES) - 1 - band] >= SOLVE_THRESHOLD:
+            return band
+    return len(LIVES) - 1
+
+
+def rated_word_lists(word_lists, ratings):
+    """Return word lists with each category's words re-banded by rating.
+
+    Each rated word goes to the band from band_of. If that leaves a band
+    empty, the words are instead sorted by their solve rates (hardest
+    difficulty's lives first) and split into thirds. Categories without
+    ratings keep their original lists. Meant for compiling a rated corpus,
+    as it builds the lists in memory.
+    """
+    banded = {}
+    for category in word_lists:
+        entries = ratings.get(category)
+        words = [word for word in category_words(word_lists, category) if entries and word in entries]
+        if len(words) < len(BAND_KEYS):
+            banded[category] = {key: list(words) for key, words in word_lists[category].items()}
+            continue
+        bands = banded[category] = {key: [] for key in BAND_KEYS}
+        for word in words:
+            bands[BAND_KEYS[band_of(entries[word])]].append(word)
+        if all(bands.values()):
+            continue
+        words.sort(key=lambda word: ([-solved for solved in reversed(entries[word]["solved"])], entries[word]["wrong"], word))
+        for band, key in enumerate(BAND_KEYS):
+            bands[key] = words[band * len(words) // len(BAND_KEYS):(band + 1) * len(words) // len(BAND_KEYS)]
+    return banded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rate Hangman words by simulated solve difficulty")
+    parser.add_argument("--corpus", help="corpus file to rate (default: the built-in words)")
+    parser.add_argument("--output", default="word_ratings.json", help="rating table to update")
+    parser.add_argument("--trials", type=int, default=TRIALS, help="games played per word")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--force", action="store_true", help="rate every word again")
+    parser.add_argument("--compile", metavar="CORPUS", help="write the words banded by rating to this corpus file")
+    args = parser.parse_args(argv)
+
+    source = args.corpus or categories
+    ratings = {} if args.force else load_ratings(args.output)
+    ratings, rated = update_ratings(source, ratings, args.trials, args.workers)
+    save_ratings(ratings, args.output)
+    total = sum(len(entries) for entries in ratings.values())
+    print(f"Rated {rated} of {total} words, wrote {args.output}")
+    if args.compile:
+        word_lists = Corpus(source) if isinstance(source, str) else source
+        banded = rated_word_lists(word_lists, ratings)
+        # The output may replace the corpus being read, which fails while it is mapped on Windows
+        if word_lists is not source:
+            word_lists.close()
+        compile_corpus(banded, args.compile)
+        print(f"Wrote {args.compile}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
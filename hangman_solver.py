@@ -0,0 +1,250 @@
+"""
+Candidate filtering solver for Hangman word lists.
+
+Words are bucketed by length. Inside a bucket every word gets an id, and for
+each letter (and each letter at each position) the bucket keeps a bitset of
+the ids that match, stored as a Python int. Narrowing the candidates after a
+guess is then a handful of big-int ANDs, and letter frequencies over the
+remaining candidates are one AND and a popcount per letter, so it stays at
+interactive latency for corpora with hundreds of thousands of words.
+
+The same bitsets drive EvilHangmanRound, which never commits to a word: each
+guess splits the remaining candidates into families by where the letter
+appears and keeps the largest family.
+"""
+import random
+
+from hangman_engine import DIFFICULTY_SETTINGS, FREQUENCY_ORDER, HangmanRound
+
+
+# Number of set bits - int.bit_count is available from Python 3.10
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:
+    def popcount(bits):
+        return bin(bits).count("1")
+
+
+def bits_from_ids(ids, size):
+    """Return a bitset with the given ids set"""
+    buffer = bytearray((size + 7) // 8)
+    for word_id in ids:
+        buffer[word_id >> 3] |= 1 << (word_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class LengthBucket:
+    def __init__(self, length, words):
+        self.length = length
+        self.words = words
+        self.all = (1 << len(words)) - 1
+
+        # Collect ids per letter and per (position, letter), then pack each
+        # list into a bitset once; OR-ing bits in one at a time is quadratic
+        containing = {}
+        at_position = [{} for _ in range(length)]
+        for word_id, word in enumerate(words):
+            for position, letter in enumerate(word):
+                at_position[position].setdefault(letter, []).append(word_id)
+            for letter in set(word):
+                containing.setdefault(letter, []).append(word_id)
+
+        size = len(words)
+        self.containing = {letter: bits_from_ids(ids, size) for letter, ids in containing.items()}
+        self.at_position = [{letter: bits_from_ids(ids, size) for letter, ids in letters.items()}
+                            for letters in at_position]
+
+
+class WordIndex:
+    def __init__(self, words):
+        by_length = {}
+        for word in dict.fromkeys(word.lower() for word in words):
+            by_length.setdefault(len(word), []).append(word)
+        self.buckets = {length: LengthBucket(length, bucket_words) for length, bucket_words in by_length.items()}
+
+    @classmethod
+    def from_categories(cls, word_lists, category=None):
+        """Index the words of one category, or of every category"""
+        names = [category] if category is not None else list(word_lists)
+        return cls(word for name in names for words in word_lists[name].values() for word in words)
+
+    def __len__(self):
+        return sum(len(bucket.words) for bucket in self.buckets.values())
+
+    def candidates(self, pattern, guessed_letters=()):
+        """Return the candidates for a pattern ("_" or None = hidden) and the guesses so far"""
+        bucket = self.buckets.get(len(pattern))
+        if bucket is None:
+            return Candidates(None, 0)
+        result = Candidates(bucket, bucket.all)
+
+        revealed = {}
+        for position, letter in enumerate(pattern):
+            if letter is not None and letter != "_":
+                revealed.setdefault(letter, []).append(position)
+        for letter in dict.fromkeys(guessed_letters):
+            result.apply(letter, revealed.get(letter, ()))
+        return result
+
+
+class Candidates:
+    def __init__(self, bucket, bits):
+        self.bucket = bucket
+        self.bits = bits
+        self.guessed = set()
+
+    def __len__(self):
+        return popcount(self.bits)
+
+    def apply(self, letter, positions):
+        """Narrow the candidates after guessing letter, which was revealed at positions"""
+        self.guessed.add(letter)
+        if self.bucket is None:
+            return
+        if not positions:
+            self.bits &= ~self.bucket.containing.get(letter, 0)
+            return
+
+        # The letter must appear at exactly the revealed positions
+        positions = set(positions)
+        for position, letters in enumerate(self.bucket.at_position):
+            letter_bits = letters.get(letter, 0)
+            if position in positions:
+                self.bits &= letter_bits
+            else:
+                self.bits &= ~letter_bits
+
+    def match_non_letters(self, word):
+        """Keep only the candidates with word's non-letters (spaces, hyphens) in the same places"""
+        if self.bucket is None:
+            return
+        for character in self.bucket.containing:
+            if character.isalpha():
+                continue
+            positions = {position for position, word_character in enumerate(word) if word_character == character}
+            for position, letters in enumerate(self.bucket.at_position):
+                character_bits = letters.get(character, 0)
+                if position in positions:
+                    self.bits &= character_bits
+                else:
+                    self.bits &= ~character_bits
+
+    def partition(self, letter):
+        """Split the candidates by the positions of letter; returns {positions: bits}"""
+        if self.bucket is None or not self.bits:
+            return {}
+        letter_bits = self.bucket.containing.get(letter, 0)
+        families = {}
+        without = self.bits & ~letter_bits
+        if without:
+            families[()] = without
+
+        # Split the words containing the letter one position at a time; each
+        # family is a single AND per position, however many words it holds
+        groups = [((), self.bits & letter_bits)] if self.bits & letter_bits else []
+        for position, letters in enumerate(self.bucket.at_position):
+            at_bits = letters.get(letter, 0)
+            if not at_bits:
+                continue
+            split = []
+            for positions, bits in groups:
+                inside = bits & at_bits
+                if inside:
+                    split.append((positions + (position,), inside))
+                if inside != bits:
+                    split.append((positions, bits & ~at_bits))
+            groups = split
+        families.update(groups)
+        return families
+
+    def words(self, limit=None):
+        """Return the candidate words, lowest ids first"""
+        words = []
+        bits = self.bits
+        while bits and (limit is None or len(words) < limit):
+            lowest = bits & -bits
+            words.append(self.bucket.words[lowest.bit_length() - 1])
+            bits ^= lowest
+        return words
+
+    def letter_frequencies(self):
+        """Return how many candidates contain each letter not guessed yet"""
+        if self.bucket is None:
+            return {}
+        frequencies = {}
+        for letter, letter_bits in self.bucket.containing.items():
+            if letter not in self.guessed:
+                count = popcount(self.bits & letter_bits)
+                if count:
+                    frequencies[letter] = count
+        return frequencies
+
+    def best_letter(self, rng=None):
+        """Return the unguessed letter found in the most candidates, breaking
+        ties at random when an rng is given"""
+        frequencies = {letter: count for letter, count in self.letter_frequencies().items() if letter.isalpha()}
+        if not frequencies:
+            return None
+        if rng is None:
+            return max(frequencies, key=frequencies.get)
+        best = max(frequencies.values())
+        return rng.choice(sorted(letter for letter, count in frequencies.items() if count == best))
+
+
+def solver_policy(index):
+    """Return a simulation policy that guesses the most frequent candidate letter"""
+    def policy(hangman_round, rng):
+        letter = index.candidates(hangman_round.revealed, hangman_round.guessed_letters).best_letter()
+        if letter is None:
+            # No candidate fits (word not in the index) - fall back to frequency order
+            for letter in FREQUENCY_ORDER:
+                if not hangman_round.has_guessed(letter):
+                    return letter
+        return letter
+    return policy
+
+
+class EvilHangmanRound(HangmanRound):
+    """A round that keeps the largest family of candidates instead of a fixed word.
+
+    word always holds one remaining candidate, so the display and the win
+    check work as in a normal round.
+    """
+
+    def __init__(self, candidates, max_wrong_guesses=6, timer_duration=0):
+        super().__init__(candidates.words(1)[0], max_wrong_guesses, timer_duration)
+        self.candidates = candidates
+
+    def guess(self, letter):
+        if self.is_over or self.has_guessed(letter):
+            return None
+        families = self.candidates.partition(letter)
+        if families:
+            # Largest family wins; on a tie, prefer revealing fewer letters
+            positions = max(families, key=lambda positions: (popcount(families[positions]), -len(positions)))
+            self.candidates.bits = families[positions]
+            # Every word in the family reveals the same letters in the same places
+            self.set_word(self.candidates.words(1)[0])
+        self.candidates.guessed.add(letter)
+        return super().guess(letter)
+
+
+def new_evil_round(category, difficulty, rng=random, word_lists=None, settings=DIFFICULTY_SETTINGS, indexes=None):
+    """Start an evil round over the words of the same length as a random pick.
+
+    indexes caches the WordIndex built per (category, difficulty) between rounds.
+    """
+    difficulty_settings = settings[difficulty]
+    words = word_lists[category][difficulty_settings["key"]]
+    key = (category, difficulty_settings["key"])
+    index = indexes.get(key) if indexes is not None else None
+    if index is None:
+        index = WordIndex(words)
+        if indexes is not None:
+            indexes[key] = index
+    word = rng.choice(words).lower()
+    candidates = index.candidates("_" * len(word))
+    # Non-letters are shown from the start, so every candidate must share them
+    candidates.match_non_letters(word)
+    return EvilHangmanRound(candidates, difficulty_settings["max_wrong_guesses"],
+                            difficulty_settings["timer_duration"])
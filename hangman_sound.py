@@ -0,0 +1,100 @@
+"""
+Sine-wave sound synthesis for the Hangman game.
+
+Beeps are generated in bulk in the mixer's own sample format (size, signedness
+and channel count as reported by pygame.mixer.get_init()), using NumPy when it
+is installed and the array module otherwise. Generated buffers are cached on
+disk, keyed by their parameters, so later launches just read the bytes back.
+"""
+import array
+import hashlib
+import math
+import os
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Bump when the synthesis changes so stale cache files are ignored
+CACHE_VERSION = 1
+
+# Where generated buffers are kept between launches
+CACHE_DIR = os.environ.get(
+    "HANGMAN_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "hangman-game"),
+)
+
+# Mixer sample size -> (array typecode, NumPy dtype, amplitude, offset).
+# Positive sizes are unsigned integers except 32, which SDL uses for float32.
+SAMPLE_FORMATS = {
+    8: ("B", "uint8", 127, 128),
+    -8: ("b", "int8", 127, 0),
+    16: ("H", "uint16", 32767, 32768),
+    -16: ("h", "int16", 32767, 0),
+    -32: ("i", "int32", 2147483647, 0),
+    32: ("f", "float32", 1.0, 0),
+}
+
+
+def synthesize_beep(frequency, duration, volume, sample_rate, size=-16, channels=1):
+    """Return raw sample bytes for a sine beep in the given mixer format"""
+    typecode, dtype, amplitude, offset = SAMPLE_FORMATS[size]
+    n_samples = int(round(duration * sample_rate))
+    step = 2.0 * math.pi * frequency / sample_rate
+    peak = amplitude * volume
+
+    if numpy is not None:
+        samples = peak * numpy.sin(step * numpy.arange(n_samples)) + offset
+        if dtype != "float32":
+            samples = numpy.trunc(samples)
+        # Repeat each sample once per channel to interleave the frames
+        return numpy.repeat(samples.astype(dtype), channels).tobytes()
+
+    # Without NumPy, map over C-level callables instead of a Python loop
+    values = map(peak.__mul__, map(math.sin, map(step.__mul__, range(n_samples))))
+    if typecode != "f":
+        values = map(offset.__add__, map(int, values))
+    mono = array.array(typecode, values)
+    if channels == 1:
+        return mono.tobytes()
+
+    # Interleave the same samples into every channel
+    frames = array.array(typecode, bytes(mono.itemsize * n_samples * channels))
+    for channel in range(channels):
+        frames[channel::channels] = mono
+    return frames.tobytes()
+
+
+def cache_path(frequency, duration, volume, mixer_format):
+    """Return the cache file for a beep's parameters"""
+    key = repr((CACHE_VERSION, frequency, duration, volume, tuple(mixer_format)))
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, "sounds", f"beep-{digest}.raw")
+
+
+def beep_bytes(frequency, duration, volume, mixer_format, use_cache=True):
+    """Return beep samples for a (frequency, size, channels) mixer format"""
+    sample_rate, size, channels = mixer_format
+    path = cache_path(frequency, duration, volume, mixer_format)
+
+    if use_cache:
+        try:
+            with open(path, "rb") as cached:
+                return cached.read()
+        except OSError:
+            pass
+
+    data = synthesize_beep(frequency, duration, volume, sample_rate, size, channels)
+
+    if use_cache:
+        # Write to a temporary file first so a crash never leaves a torn buffer
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as cached:
+                cached.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+    return data
@@ -0,0 +1,40 @@
+"""
+Word lists for the Hangman game, grouped by category and difficulty.
+
+Kept free of pygame so tools and tests can import the words without
+opening a window.
+"""
+
+# Game data - categorized by difficulty
+categories = {
+    "Animals": {
+        "easy": ["dog", "cat", "pig", "fox", "cow", "rat", "bat", "hen", "bee", "ant"],
+        "medium": ["tiger", "zebra", "koala", "panda", "camel", "eagle", "shark", "snake", "horse", "sheep"],
+        "hard": ["elephant", "giraffe", "penguin", "kangaroo", "dolphin", "rhinoceros", "crocodile", "octopus", "cheetah", "panther"]
+    },
+    "Movies": {
+        "easy": ["jaws", "star", "cars", "up", "toy", "lion", "wall", "bolt", "soul", "nemo"],
+        "medium": ["frozen", "avatar", "matrix", "aliens", "psycho", "shrek", "titanic", "batman", "joker", "rocky"],
+        "hard": ["inception", "gladiator", "interstellar", "casablanca", "godfather", "parasite", "whiplash", "braveheart", "goodfellas", "apocalypse"]
+    },
+    "Countries": {
+        "easy": ["usa", "cuba", "peru", "mali", "fiji", "iran", "iraq", "chad", "togo", "laos"],
+        "medium": ["japan", "india", "china", "spain", "italy", "kenya", "egypt", "chile", "sudan", "nepal"],
+        "hard": ["australia", "argentina", "singapore", "switzerland", "kazakhstan", "mozambique", "bangladesh", "madagascar", "azerbaijan", "kyrgyzstan"]
+    },
+    "Sports": {
+        "easy": ["golf", "swim", "run", "ski", "surf", "bike", "judo", "yoga", "polo", "bowl"],
+        "medium": ["soccer", "tennis", "hockey", "boxing", "karate", "rowing", "diving", "cricket", "cycling", "fencing"],
+        "hard": ["basketball", "volleyball", "gymnastics", "wrestling", "badminton", "skateboard", "snowboard", "waterpolo", "taekwondo", "equestrian"]
+    },
+    "Fruits": {
+        "easy": ["pear", "plum", "lime", "kiwi", "fig", "date", "apple", "grape", "melon", "mango"],
+        "medium": ["orange", "banana", "cherry", "papaya", "guava", "lychee", "apricot", "peach", "lemon", "coconut"],
+        "hard": ["pineapple", "watermelon", "strawberry", "blueberry", "blackberry", "raspberry", "cranberry", "dragonfruit", "passionfruit", "pomegranate"]
+    },
+    "Cars": {
+        "easy": ["ford", "audi", "jeep", "kia", "mini", "seat", "fiat", "bmw", "saab", "opel"],
+        "medium": ["toyota", "nissan", "honda", "mazda", "subaru", "volvo", "lexus", "jaguar", "tesla", "porsche"],
+        "hard": ["mercedes", "lamborghini", "maserati", "bentley", "ferrari", "bugatti", "chevrolet", "mitsubishi", "volkswagen", "rolls-royce"]
+    }
+}